@@ -0,0 +1,191 @@
+"""Shared helpers for the MkDocs wrapper scripts.
+
+When mkdocs is importable from the running interpreter the commands run
+in-process, which skips a second interpreter start-up and the mkdocs import
+on every invocation. Otherwise they fall back to the ``mkdocs`` CLI.
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# logging, subprocess, shutil and contextlib are imported where used: each
+# code path needs only some of them, and start-up time matters for these
+# short-lived scripts.
+
+
+def project_parser(description: str) -> argparse.ArgumentParser:
+    """Return an argument parser with the shared ``project_dir`` positional."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "project_dir",
+        type=Path,
+        nargs="?",
+        default=Path.cwd(),
+        help="Project directory (default: current directory)",
+    )
+    return parser
+
+
+def find_config(project_dir: Path) -> Path | None:
+    """Return the project's mkdocs.yml, printing a hint when it is missing."""
+    mkdocs_yml = project_dir / "mkdocs.yml"
+    if not mkdocs_yml.exists():
+        print(f"Error: mkdocs.yml not found at {mkdocs_yml}")
+        print("Run 'init_docs.py' first to initialize the documentation.")
+        return None
+    return mkdocs_yml
+
+
+def mkdocs_importable() -> bool:
+    """Return True if mkdocs can run inside the current interpreter."""
+    return importlib.util.find_spec("mkdocs") is not None
+
+
+def load_project_config(mkdocs_yml: Path, *, strict: bool = False) -> Any:
+    """Load mkdocs.yml into a fresh config.
+
+    A new object is returned on every call: a build mutates its config (plugin
+    ``on_config`` hooks, theme and nav state), so configs are never shared
+    between builds.
+    """
+    from mkdocs.config import load_config
+
+    return load_config(config_file=str(mkdocs_yml), strict=strict)
+
+
+def run_in_process(mkdocs_yml: Path, command: Callable[[], None]) -> int:
+    """Run an mkdocs API call from the project directory and return an exit code."""
+    import contextlib
+    import logging
+
+    from mkdocs.exceptions import MkDocsException
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-8s-  %(message)s")
+    try:
+        with contextlib.chdir(mkdocs_yml.parent):
+            command()
+    except MkDocsException as e:
+        print(f"Error: {e.format_message()}")
+        return 1
+    return 0
+
+
+def build_site(
+    mkdocs_yml: Path,
+    *,
+    strict: bool = False,
+    dirty: bool = False,
+    cache_dir: Path | None = None,
+    jobs: int = 1,
+) -> int:
+    """Build the site in-process, mirroring ``mkdocs build``.
+
+    With ``cache_dir`` rendered pages are memoized across builds by content hash.
+    With ``jobs`` > 1 Markdown rendering is spread over that many processes.
+    """
+    from mkdocs.commands.build import build
+
+    def command() -> None:
+        cfg = load_project_config(mkdocs_yml, strict=strict)
+        if cache_dir is not None and "page-cache" not in cfg.plugins:
+            from _page_cache import PageCachePlugin
+
+            cfg.plugins["page-cache"] = PageCachePlugin(cache_dir)
+        cfg.plugins.on_startup(command="build", dirty=dirty)
+        try:
+            if jobs > 1:
+                from _parallel_render import parallel_render
+
+                with parallel_render(cfg, jobs):
+                    build(cfg, dirty=dirty)
+            else:
+                build(cfg, dirty=dirty)
+        finally:
+            cfg.plugins.on_shutdown()
+
+    return run_in_process(mkdocs_yml, command)
+
+
+def deploy_site(mkdocs_yml: Path, *, message: str | None = None, force: bool = False) -> int:
+    """Build and push the site in-process, mirroring ``mkdocs gh-deploy``."""
+    from mkdocs.commands.build import build
+    from mkdocs.commands.gh_deploy import gh_deploy
+
+    def command() -> None:
+        cfg = load_project_config(mkdocs_yml)
+        cfg.plugins.on_startup(command="gh-deploy", dirty=False)
+        try:
+            build(cfg)
+        finally:
+            cfg.plugins.on_shutdown()
+        gh_deploy(cfg, message=message, force=force)
+
+    return run_in_process(mkdocs_yml, command)
+
+
+def serve_site(mkdocs_yml: Path, *, dev_addr: str, debounce: float | None = None) -> int:
+    """Serve the site in-process, mirroring ``mkdocs serve``.
+
+    ``debounce`` is the quiet period (seconds) the file watcher waits for after
+    the last change before rebuilding, so a burst of writes triggers one build.
+    """
+    from mkdocs.commands import serve as serve_command
+    from mkdocs.livereload import LiveReloadServer
+
+    if debounce is not None:
+
+        class DebouncedServer(LiveReloadServer):
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                super().__init__(*args, **kwargs)
+                self.build_delay = debounce
+
+        serve_command.LiveReloadServer = DebouncedServer
+
+    return run_in_process(
+        mkdocs_yml,
+        lambda: serve_command.serve(config_file=str(mkdocs_yml), dev_addr=dev_addr),
+    )
+
+
+def find_mkdocs() -> str | None:
+    """Return the path of the mkdocs executable, printing install hints if absent."""
+    import shutil
+
+    mkdocs_bin = shutil.which("mkdocs")
+    if mkdocs_bin is None:
+        print("Error: 'mkdocs' not found. Install with: uv add --dev mkdocs mkdocs-material")
+    return mkdocs_bin
+
+
+def run_mkdocs(subcommand: str, mkdocs_yml: Path, extra_args: list[str] | None = None) -> int:
+    """Run ``mkdocs <subcommand>`` from the directory containing mkdocs.yml."""
+    mkdocs_bin = find_mkdocs()
+    if mkdocs_bin is None:
+        return 1
+
+    import subprocess
+
+    cmd = [mkdocs_bin, subcommand, "-f", str(mkdocs_yml), *(extra_args or [])]
+    result = subprocess.run(cmd, cwd=mkdocs_yml.parent)
+    return result.returncode
+
+
+def exec_mkdocs(subcommand: str, mkdocs_yml: Path, extra_args: list[str] | None = None) -> int:
+    """Replace the current process with ``mkdocs <subcommand>``.
+
+    Used for long-running commands whose exit status needs no follow-up, so no
+    parent interpreter stays resident and Ctrl+C goes straight to mkdocs.
+    Only returns (with 1) when mkdocs is not installed.
+    """
+    mkdocs_bin = find_mkdocs()
+    if mkdocs_bin is None:
+        return 1
+
+    sys.stdout.flush()
+    os.chdir(mkdocs_yml.parent)
+    os.execv(mkdocs_bin, [mkdocs_bin, subcommand, "-f", str(mkdocs_yml), *(extra_args or [])])
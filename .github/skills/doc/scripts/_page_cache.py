@@ -0,0 +1,128 @@
+"""Content-hash cache of rendered Markdown for in-process mkdocs builds.
+
+Each page is keyed by the SHA-256 of its final Markdown, its source path, the
+Markdown extension config, and the documentation file list (relative links
+resolve against it). A hit restores the HTML, table of contents and anchor
+links from disk instead of running the Markdown converter again. Pages whose
+render logged a warning are never stored, so the warning (and strict mode's
+failure) recurs on every build until the page is fixed.
+"""
+
+import hashlib
+import json
+import logging
+import shutil
+from pathlib import Path
+from typing import Any
+
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.plugins import BasePlugin, event_priority
+from mkdocs.structure.files import Files
+from mkdocs.structure.pages import Page
+from mkdocs.structure.toc import AnchorLink, get_toc
+from mkdocs.utils import CountHandler
+
+log = logging.getLogger("mkdocs.plugins.page_cache")
+
+# Bumped when the entry layout changes, so entries written by older versions
+# (which may hold pages that rendered with warnings) are not reused.
+_CACHE_VERSION = 2
+
+
+def _qualified_name(obj: Any) -> str:
+    # Extension configs may hold callables (e.g. superfences formatters) whose
+    # repr embeds a memory address; name them instead so keys stay stable.
+    return (
+        f"{getattr(obj, '__module__', '')}.{getattr(obj, '__qualname__', type(obj).__qualname__)}"
+    )
+
+
+def _toc_tokens(items: list[AnchorLink]) -> list[dict[str, Any]]:
+    return [
+        {"level": i.level, "id": i.id, "name": i.title, "children": _toc_tokens(i.children)}
+        for i in items
+    ]
+
+
+class PageCachePlugin(BasePlugin):
+    """Skip Markdown conversion for pages whose rendered output is cached."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        super().__init__()
+        self.cache_dir = cache_dir
+        self._config_key = b""
+        self.hits = 0
+        self.misses = 0
+
+    def on_files(self, files: Files, *, config: MkDocsConfig) -> Files:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        h = hashlib.sha256(f"v{_CACHE_VERSION}".encode())
+        markdown_config = [
+            config["markdown_extensions"],
+            config["mdx_configs"],
+            config["use_directory_urls"],
+        ]
+        h.update(json.dumps(markdown_config, sort_keys=True, default=_qualified_name).encode())
+        for file in sorted(files, key=lambda f: f.src_uri):
+            h.update(file.src_uri.encode())
+        self._config_key = h.digest()
+        return files
+
+    # Run after every other plugin so the key covers the final Markdown.
+    @event_priority(-100)
+    def on_page_markdown(
+        self, markdown: str, *, page: Page, config: MkDocsConfig, files: Files
+    ) -> str:
+        h = hashlib.sha256(self._config_key)
+        h.update(page.file.src_uri.encode())
+        h.update(markdown.encode())
+        entry = self.cache_dir / f"{h.hexdigest()[:16]}.json"
+        render = page.render
+
+        def cached_render(config: MkDocsConfig, files: Files) -> None:
+            try:
+                state = json.loads(entry.read_bytes())
+            except (OSError, ValueError):
+                self.misses += 1
+                warnings = CountHandler()
+                warnings.setLevel(logging.WARNING)
+                mkdocs_log = logging.getLogger("mkdocs")
+                mkdocs_log.addHandler(warnings)
+                try:
+                    render(config, files)
+                finally:
+                    mkdocs_log.removeHandler(warnings)
+                if warnings.get_counts():
+                    return
+                links = page.links_to_anchors
+                state = {
+                    "content": page.content,
+                    "toc": _toc_tokens(page.toc.items),
+                    "title": page._title_from_render,
+                    "anchors": sorted(page.present_anchor_ids or ()),
+                    "links": None if links is None else {f.src_uri: a for f, a in links.items()},
+                }
+                entry.write_text(json.dumps(state))
+                return
+            self.hits += 1
+            page.content = state["content"]
+            page.toc = get_toc(state["toc"])
+            page._title_from_render = state["title"]
+            page.present_anchor_ids = set(state["anchors"])
+            if state.get("links") is not None:
+                page.links_to_anchors = {
+                    files.get_file_from_path(uri): a for uri, a in state["links"].items()
+                }
+
+        page.render = cached_render
+        return markdown
+
+    def on_post_build(self, *, config: MkDocsConfig) -> None:
+        # Pages rendered in parallel workers update their own copies of the counters.
+        if self.hits or self.misses:
+            log.info(f"Page cache: {self.hits} hit(s), {self.misses} miss(es)")
+
+
+def clear_cache(cache_dir: Path) -> None:
+    """Remove every cached page."""
+    shutil.rmtree(cache_dir, ignore_errors=True)
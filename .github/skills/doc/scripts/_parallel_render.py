@@ -0,0 +1,161 @@
+"""Parallel Markdown rendering for in-process mkdocs builds.
+
+mkdocs converts pages one at a time. While :func:`parallel_render` is active,
+the first page a build reads triggers a fan-out: every page's plugin hooks up
+to ``on_page_markdown`` run in the parent, the Markdown-to-HTML conversion
+runs in forked worker processes, and the build loop then picks up the
+rendered pages in its usual order and runs ``on_page_content`` itself.
+
+Messages a worker logs under the ``mkdocs`` logger (e.g. unresolved-link
+warnings) are collected instead of printed and re-logged in the parent as each
+page is picked up, so strict mode counts them and they appear once.
+"""
+
+import contextlib
+import logging
+import multiprocessing
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from mkdocs.commands import build as build_command
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.structure.files import Files
+from mkdocs.structure.pages import Page
+
+log = logging.getLogger("mkdocs.plugins.parallel_render")
+
+# Set in the parent right before forking so workers inherit the pages, config
+# and file list instead of having them pickled per task.
+_work: tuple[list[Page], MkDocsConfig, Files] | None = None
+
+
+class _LogCollector(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[tuple[str, int, str]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append((record.name, record.levelno, record.getMessage()))
+
+
+def _render(index: int) -> dict[str, Any]:
+    assert _work is not None
+    pages, config, files = _work
+    page = pages[index]
+    # The worker's copy of mkdocs' strict-mode counter is discarded, so route
+    # the records back to the parent instead of emitting them here.
+    mkdocs_log = logging.getLogger("mkdocs")
+    collector = _LogCollector()
+    handlers, propagate = mkdocs_log.handlers, mkdocs_log.propagate
+    mkdocs_log.handlers, mkdocs_log.propagate = [collector], False
+    try:
+        page.render(config, files)
+    finally:
+        mkdocs_log.handlers, mkdocs_log.propagate = handlers, propagate
+    links = page.links_to_anchors
+    return {
+        "logs": collector.records,
+        "content": page.content,
+        "toc": page.toc,
+        "title": page._title_from_render,
+        "anchors": page.present_anchor_ids,
+        "links": None if links is None else {f.src_uri: a for f, a in links.items()},
+    }
+
+
+class _ParallelPopulate:
+    """Drop-in replacement for ``mkdocs.commands.build._populate_page``."""
+
+    def __init__(self, jobs: int, populate: Any) -> None:
+        self.jobs = jobs
+        self.populate = populate
+        self.rendered: dict[str, dict[str, Any]] | None = None
+
+    def __call__(self, page: Page, config: MkDocsConfig, files: Files, dirty: bool = False) -> None:
+        if self.rendered is None:
+            self.rendered = self._render_all(config, files, dirty)
+        state = self.rendered.pop(page.file.src_uri, None)
+        if state is None:
+            # Pages created during the build loop (not in nav) or skipped by
+            # a dirty build take the normal sequential path.
+            self.populate(page, config, files, dirty)
+            return
+
+        for name, level, message in state["logs"]:
+            logging.getLogger(name).log(level, message)
+        config._current_page = page
+        try:
+            page.content = state["content"]
+            page.toc = state["toc"]
+            page._title_from_render = state["title"]
+            page.present_anchor_ids = state["anchors"]
+            if state["links"] is not None:
+                page.links_to_anchors = {
+                    files.get_file_from_path(uri): a for uri, a in state["links"].items()
+                }
+            page.content = config.plugins.on_page_content(
+                page.content, page=page, config=config, files=files
+            )
+        finally:
+            config._current_page = None
+
+    def _render_all(
+        self, config: MkDocsConfig, files: Files, dirty: bool
+    ) -> dict[str, dict[str, Any]]:
+        global _work
+
+        pages = []
+        for file in files.documentation_pages():
+            page = file.page
+            if page is None or (dirty and not file.is_modified()):
+                continue
+            config._current_page = page
+            try:
+                page = config.plugins.on_pre_page(page, config=config, files=files)
+                page.read_source(config)
+                page.markdown = config.plugins.on_page_markdown(
+                    page.markdown, page=page, config=config, files=files
+                )
+            finally:
+                config._current_page = None
+            pages.append(page)
+
+        log.info(f"Rendering {len(pages)} page(s) with {self.jobs} worker processes")
+        _work = (pages, config, files)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.jobs, mp_context=multiprocessing.get_context("fork")
+            ) as pool:
+                results = pool.map(_render, range(len(pages)))
+                return {p.file.src_uri: r for p, r in zip(pages, results, strict=True)}
+        finally:
+            _work = None
+
+
+@contextlib.contextmanager
+def parallel_render(config: MkDocsConfig, jobs: int) -> Iterator[None]:
+    """Render pages of builds run inside this context on ``jobs`` processes.
+
+    Falls back to mkdocs' sequential rendering when a plugin hooks
+    ``on_page_content`` (it may rely on seeing each page's Markdown and HTML
+    events back to back) or when the platform cannot fork.
+    """
+    if jobs <= 1:
+        yield
+        return
+    if config.plugins.events["page_content"]:
+        log.info("A plugin handles on_page_content; rendering pages sequentially")
+        yield
+        return
+    if "fork" not in multiprocessing.get_all_start_methods():
+        log.info("Parallel rendering needs fork(); rendering pages sequentially")
+        yield
+        return
+
+    populate = build_command._populate_page
+    build_command._populate_page = _ParallelPopulate(jobs, populate)
+    try:
+        yield
+    finally:
+        build_command._populate_page = populate
@@ -1,48 +1,225 @@
 #!/usr/bin/env python3
 """Build MkDocs documentation for production."""
 
-import argparse
-import subprocess
+import hashlib
+import os
 import sys
 from pathlib import Path
+from typing import Any
 
+from _mkdocs_common import (
+    build_site,
+    find_config,
+    mkdocs_importable,
+    project_parser,
+    run_mkdocs,
+)
 
-def build_docs(project_dir: Path, strict: bool = False, clean: bool = True) -> int:
-    """Build documentation for production."""
-    mkdocs_yml = project_dir / "mkdocs.yml"
-    if not mkdocs_yml.exists():
-        print(f"Error: mkdocs.yml not found at {mkdocs_yml}")
-        print("Run 'init_docs.py' first to initialize the documentation.")
+# The page cache's default location; the build fingerprint lives there too,
+# outside site_dir, so it is never published with the site.
+CACHE_DIR = ".mkdocs-cache"
+
+# Stands in for any tagged YAML value, which only mkdocs can resolve.
+_TAGGED = object()
+
+
+def _read_yaml(path: Path) -> tuple[dict[str, Any], list[Path]] | None:
+    """Load a config file as plain YAML, following ``INHERIT`` to its parents.
+
+    mkdocs' own tags (``!ENV``, ``!relative``, ``!!python/name``...) load as
+    ``_TAGGED`` instead of being resolved, so this needs only PyYAML.
+    Returns the merged mapping and the files read, or None if PyYAML is
+    missing or the file does not parse.
+    """
+    try:
+        import yaml
+    except ImportError:
+        return None
+
+    class Loader(yaml.SafeLoader):
+        pass
+
+    Loader.add_multi_constructor("", lambda loader, suffix, node: _TAGGED)
+    try:
+        with path.open("rb") as f:
+            data = yaml.load(f, Loader=Loader)
+    except (OSError, yaml.YAMLError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    parent = data.pop("INHERIT", None)
+    if not isinstance(parent, str):
+        return data, [path]
+    base = _read_yaml(path.parent / parent)
+    if base is None:
+        return None
+    return _merge(base[0], data), [*base[1], path]
+
+
+def _merge(base: dict[str, Any], child: dict[str, Any]) -> dict[str, Any]:
+    # Same deep merge mkdocs applies to INHERIT: mappings merge, anything else
+    # in the child replaces the parent's value.
+    merged = dict(base)
+    for key, value in child.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def build_inputs(mkdocs_yml: Path) -> tuple[Path, list[Path]] | None:
+    """Return the configured ``site_dir`` and the paths a build reads from.
+
+    The inputs are mkdocs.yml (and any ``INHERIT`` parents), ``docs_dir``, the
+    theme's ``custom_dir``, any ``watch`` paths and the ``hooks`` scripts,
+    read from the raw YAML so the up-to-date check never imports mkdocs.
+    Returns None when a path cannot be determined that way (e.g. it is set
+    through ``!ENV``). Installed plugins and anything a hook imports are not
+    tracked; pass ``--force`` after changing those.
+    """
+    loaded = _read_yaml(mkdocs_yml)
+    if loaded is None:
+        return None
+    data, files = loaded
+    theme = data.get("theme")
+    custom_dir = theme.get("custom_dir") if isinstance(theme, dict) else None
+    watch = data.get("watch") or []
+    hooks = data.get("hooks") or []
+    if not (isinstance(watch, list) and isinstance(hooks, list)):
+        return None
+    paths = [data.get("docs_dir", "docs"), data.get("site_dir", "site"), *watch, *hooks]
+    if custom_dir is not None:
+        paths.append(custom_dir)
+    if not all(isinstance(p, str) for p in paths):
+        return None
+    # mkdocs resolves relative paths against the directory of mkdocs.yml.
+    root = mkdocs_yml.parent
+    docs_dir, site_dir, *extra = (root / p for p in paths)
+    return site_dir, [*files, docs_dir, *extra]
+
+
+def docs_fingerprint(inputs: list[Path], *salt: str) -> str:
+    """Hash the path, size, and mtime of every file under ``inputs``.
+
+    Dot-directories and ``__pycache__`` are skipped. ``salt`` folds build
+    options into the result.
+    """
+    h = hashlib.blake2b("\0".join(salt).encode(), digest_size=16)
+    for top in inputs:
+        if top.is_file():
+            st = top.stat()
+            h.update(f"{top}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+            continue
+        for root, dirs, files in os.walk(top):
+            dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d != "__pycache__")
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                st = os.stat(path)
+                h.update(f"{path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return h.hexdigest()
+
+
+def fingerprint_path(project_dir: Path, site_dir: Path) -> Path:
+    """Return where the fingerprint of the last build into ``site_dir`` is kept."""
+    key = hashlib.blake2b(str(site_dir.resolve()).encode(), digest_size=8).hexdigest()
+    return project_dir / CACHE_DIR / f"build-{key}.fingerprint"
+
+
+def build_docs(
+    project_dir: Path,
+    strict: bool = False,
+    clean: bool = True,
+    dirty: bool = False,
+    cache: bool = False,
+    cache_dir: Path | None = None,
+    clean_cache: bool = False,
+    force: bool = False,
+    jobs: int = 1,
+    quiet: bool = False,
+) -> int:
+    """Build documentation for production.
+
+    With ``dirty`` only pages whose sources changed since the last build are
+    rebuilt; mkdocs rejects ``--dirty`` together with ``--clean``. With
+    ``cache`` rendered pages are reused across builds when their Markdown is
+    unchanged, and ``jobs`` > 1 renders Markdown on that many processes
+    (in-process builds only). ``quiet`` drops the "next steps" hints, for
+    callers such as deploy_docs.py that go on to publish the site.
+
+    If no source file changed since the last successful build the build is
+    skipped without importing mkdocs, unless ``force`` is set. The check reads
+    mkdocs.yml with PyYAML; if that is unavailable, or a path it needs comes
+    from a tag such as ``!ENV``, every call builds.
+    """
+    mkdocs_yml = find_config(project_dir)
+    if mkdocs_yml is None:
         return 1
 
-    cmd = ["mkdocs", "build", "-f", str(mkdocs_yml)]
-    if strict:
-        cmd.append("--strict")
-    if clean:
-        cmd.append("--clean")
+    paths = build_inputs(mkdocs_yml)
+    site_dir: Path | None = None
+    fingerprint: str | None = None
+    fingerprint_file: Path | None = None
+    if paths is not None:
+        site_dir, inputs = paths
+        fingerprint = docs_fingerprint(inputs, f"strict={strict}")
+        fingerprint_file = fingerprint_path(project_dir, site_dir)
+        if (
+            not (force or clean_cache)
+            and (site_dir / "index.html").exists()
+            and fingerprint_file.exists()
+            and fingerprint_file.read_text() == fingerprint
+        ):
+            print(f"✓ Documentation is up to date at {site_dir}")
+            return 0
+
+    cache_dir = cache_dir or project_dir / CACHE_DIR
+    if clean_cache:
+        from _page_cache import clear_cache
+
+        clear_cache(cache_dir)
+        print(f"✓ Cleared page cache at {cache_dir}")
+
+    # A build that fails partway leaves site_dir half rewritten, so the old
+    # fingerprint must not survive it.
+    if fingerprint_file is not None:
+        fingerprint_file.unlink(missing_ok=True)
 
     print("Building documentation...")
-    result = subprocess.run(cmd, cwd=project_dir)
+    if mkdocs_importable():
+        returncode = build_site(
+            mkdocs_yml,
+            strict=strict,
+            dirty=dirty,
+            cache_dir=cache_dir if cache else None,
+            jobs=jobs,
+        )
+    else:
+        extra_args = []
+        if strict:
+            extra_args.append("--strict")
+        if dirty:
+            extra_args.append("--dirty")
+        elif clean:
+            extra_args.append("--clean")
+        returncode = run_mkdocs("build", mkdocs_yml, extra_args)
 
-    if result.returncode == 0:
-        site_dir = project_dir / "site"
-        print(f"\n✓ Documentation built successfully at {site_dir}")
-        print("\nNext steps:")
-        print("  - Deploy to GitHub Pages with 'deploy_docs.py'")
-        print(f"  - Or manually deploy the contents of {site_dir}")
+    if returncode == 0:
+        if fingerprint_file is not None and fingerprint is not None:
+            fingerprint_file.parent.mkdir(parents=True, exist_ok=True)
+            fingerprint_file.write_text(fingerprint)
+        site = site_dir or "the configured site_dir"
+        print(f"\n✓ Documentation built successfully at {site}")
+        if not quiet:
+            print("\nNext steps:")
+            print("  - Deploy to GitHub Pages with 'deploy_docs.py'")
+            print(f"  - Or manually deploy the contents of {site}")
 
-    return result.returncode
+    return returncode
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="Build MkDocs documentation")
-    parser.add_argument(
-        "project_dir",
-        type=Path,
-        nargs="?",
-        default=Path.cwd(),
-        help="Project directory (default: current directory)",
-    )
+    parser = project_parser("Build MkDocs documentation")
     parser.add_argument(
         "--strict",
         action="store_true",
@@ -54,9 +231,52 @@ def main() -> int:
         action="store_false",
         help="Don't clean the site directory before building",
     )
+    parser.add_argument(
+        "--dirty",
+        action="store_true",
+        help="Only rebuild changed pages (implies --no-clean)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse rendered pages whose Markdown is unchanged since a previous build "
+        "(snippet includes are not tracked; use --clean-cache after editing them)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help=f"Page cache location (default: <project_dir>/{CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--clean-cache",
+        action="store_true",
+        help="Purge the page cache before building",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Build even if no source file changed since the last build",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Render pages on N worker processes (default: 1)",
+    )
     args = parser.parse_args()
 
-    return build_docs(args.project_dir, args.strict, args.clean)
+    return build_docs(
+        args.project_dir,
+        args.strict,
+        args.clean,
+        args.dirty,
+        args.cache or args.cache_dir is not None,
+        args.cache_dir,
+        args.clean_cache,
+        args.force,
+        args.jobs,
+    )
 
 
 if __name__ == "__main__":
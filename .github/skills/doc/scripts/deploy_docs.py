@@ -1,49 +1,185 @@
 #!/usr/bin/env python3
 """Deploy MkDocs documentation to GitHub Pages."""
 
-import argparse
+import shutil
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
+from _mkdocs_common import (
+    deploy_site,
+    find_config,
+    load_project_config,
+    mkdocs_importable,
+    project_parser,
+    run_mkdocs,
+)
+from build_docs import build_docs, build_inputs
 
-def deploy_docs(project_dir: Path, message: str | None = None, force: bool = False) -> int:
-    """Deploy documentation to GitHub Pages."""
-    mkdocs_yml = project_dir / "mkdocs.yml"
-    if not mkdocs_yml.exists():
-        print(f"Error: mkdocs.yml not found at {mkdocs_yml}")
-        print("Run 'init_docs.py' first to initialize the documentation.")
+
+def git(*args: str, cwd: Path) -> subprocess.CompletedProcess[str]:
+    """Run a git command, raising CalledProcessError on failure."""
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True)
+
+
+def publish_worktree(
+    project_dir: Path,
+    site_dir: Path,
+    remote: str,
+    branch: str,
+    message: str | None,
+    force: bool,
+) -> int | None:
+    """Commit ``site_dir`` to ``branch`` through a temporary git worktree and push it.
+
+    Unlike ``mkdocs gh-deploy`` this does not rebuild the site, and checking
+    the branch out as a worktree reuses the existing object store. Returns
+    None if the project is not a git checkout with a commit or the worktree
+    cannot be created, so the caller can fall back. The branch is started as
+    an orphan only when the remote reports it missing; any other failure to
+    reach the remote aborts, so an unreachable remote is never mistaken for an
+    empty one (which ``force`` would then overwrite).
+    """
+    if message is None:
+        try:
+            sha = git("rev-parse", "--short", "HEAD", cwd=project_dir).stdout.strip()
+        except subprocess.CalledProcessError as e:
+            print(f"Could not resolve HEAD: {e.stderr.strip()}")
+            return None
+        message = f"Deploy documentation from {sha}"
+    # --exit-code makes ls-remote return 2 only when the ref does not exist.
+    probe = subprocess.run(
+        ["git", "ls-remote", "--exit-code", remote, f"refs/heads/{branch}"],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+    )
+    if probe.returncode not in (0, 2):
+        print(f"Error: could not reach {remote}: {probe.stderr.strip()}")
+        return 1
+    exists = probe.returncode == 0
+    if exists:
+        try:
+            git(
+                "fetch",
+                remote,
+                f"+refs/heads/{branch}:refs/remotes/{remote}/{branch}",
+                cwd=project_dir,
+            )
+        except subprocess.CalledProcessError as e:
+            print(f"Error: could not fetch {remote}/{branch}: {e.stderr.strip()}")
+            return 1
+
+    worktree = Path(tempfile.mkdtemp(prefix="gh-pages-"))
+    try:
+        try:
+            if exists:
+                git(
+                    "worktree",
+                    "add",
+                    "-B",
+                    branch,
+                    str(worktree),
+                    f"{remote}/{branch}",
+                    cwd=project_dir,
+                )
+            else:
+                git("worktree", "add", "--detach", str(worktree), cwd=project_dir)
+                git("checkout", "--orphan", branch, cwd=worktree)
+        except subprocess.CalledProcessError as e:
+            print(f"Could not create a {branch} worktree: {e.stderr.strip()}")
+            return None
+
+        for entry in worktree.iterdir():
+            if entry.name == ".git":
+                continue
+            if entry.is_dir():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
+        shutil.copytree(site_dir, worktree, dirs_exist_ok=True)
+        (worktree / ".nojekyll").touch()
+
+        git("add", "--all", cwd=worktree)
+        if not git("status", "--porcelain", cwd=worktree).stdout.strip():
+            print(f"✓ {branch} is already up to date")
+            return 0
+        git("commit", "-m", message, cwd=worktree)
+        push = ["push", remote, branch]
+        if force:
+            push.append("--force")
+        git(*push, cwd=worktree)
+        return 0
+    except subprocess.CalledProcessError as e:
+        print(f"Error: {' '.join(e.cmd)} failed:\n{e.stderr}")
         return 1
+    finally:
+        subprocess.run(
+            ["git", "worktree", "remove", "--force", str(worktree)],
+            cwd=project_dir,
+            capture_output=True,
+        )
+        shutil.rmtree(worktree, ignore_errors=True)
 
-    cmd = ["mkdocs", "gh-deploy", "-f", str(mkdocs_yml)]
 
-    if message:
-        cmd.extend(["-m", message])
+def deploy_docs(
+    project_dir: Path, message: str | None = None, force: bool = False, fast: bool = False
+) -> int:
+    """Deploy documentation to GitHub Pages.
 
-    if force:
-        cmd.append("--force")
+    With ``fast`` the site is brought up to date with :func:`build_docs`
+    (a no-op when its sources are unchanged) and published to the configured
+    ``remote_branch`` on ``remote_name`` through a git worktree, instead of
+    running ``mkdocs gh-deploy``, which always rebuilds and clones the branch.
+    """
+    mkdocs_yml = find_config(project_dir)
+    if mkdocs_yml is None:
+        return 1
 
     print("Deploying to GitHub Pages...")
-    result = subprocess.run(cmd, cwd=project_dir)
+    returncode = None
+    if fast:
+        paths = build_inputs(mkdocs_yml)
+        if paths is None or not mkdocs_importable():
+            print("--fast needs mkdocs importable to read the site and remote settings")
+        else:
+            if build_docs(project_dir, quiet=True) != 0:
+                return 1
+            cfg = load_project_config(mkdocs_yml)
+            returncode = publish_worktree(
+                project_dir,
+                paths[0],
+                cfg["remote_name"],
+                cfg["remote_branch"],
+                message,
+                force,
+            )
+        if returncode is None:
+            print("Falling back to 'mkdocs gh-deploy'...")
 
-    if result.returncode == 0:
+    if returncode is None:
+        if mkdocs_importable():
+            returncode = deploy_site(mkdocs_yml, message=message, force=force)
+        else:
+            extra_args = []
+            if message:
+                extra_args.extend(["-m", message])
+            if force:
+                extra_args.append("--force")
+            returncode = run_mkdocs("gh-deploy", mkdocs_yml, extra_args)
+
+    if returncode == 0:
         print("\n✓ Documentation deployed successfully to GitHub Pages!")
         print("\nYour documentation will be available at:")
         print("  https://<username>.github.io/<repository>/")
         print("\nNote: It may take a few minutes for changes to appear.")
 
-    return result.returncode
+    return returncode
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="Deploy MkDocs documentation to GitHub Pages")
-    parser.add_argument(
-        "project_dir",
-        type=Path,
-        nargs="?",
-        default=Path.cwd(),
-        help="Project directory (default: current directory)",
-    )
+    parser = project_parser("Deploy MkDocs documentation to GitHub Pages")
     parser.add_argument(
         "-m",
         "--message",
@@ -55,9 +191,14 @@ def main() -> int:
         action="store_true",
         help="Force push to gh-pages branch (use with caution)",
     )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Publish via a git worktree, rebuilding only if sources changed",
+    )
     args = parser.parse_args()
 
-    return deploy_docs(args.project_dir, args.message, args.force)
+    return deploy_docs(args.project_dir, args.message, args.force, args.fast)
 
 
 if __name__ == "__main__":
@@ -2,10 +2,14 @@
 """Initialize MkDocs Material documentation project."""
 
 import argparse
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+_TEMPLATE_DIR = Path(__file__).resolve().parent
+_GITIGNORE_ENTRIES = (b"site/", b".mkdocs-cache/")
+
 
 def run_command(cmd: list[str], cwd: Path | None = None) -> int:
     """Run a command and return its exit code."""
@@ -26,102 +30,21 @@ def init_docs(project_dir: Path) -> int:
 
     # Create basic structure
     docs_dir.mkdir()
-    (docs_dir / "index.md").write_text(
-        """# Welcome to the Documentation
-
-This is the home page of your documentation.
-
-## Getting Started
-
-Add your documentation content here.
-
-## Features
-
-- Modern Material Design theme
-- Full-text search
-- Mobile responsive
-- Dark mode support
-- Fast static site generation
-"""
-    )
+    shutil.copyfile(_TEMPLATE_DIR / "_template_index.md", docs_dir / "index.md")
 
     # Create basic mkdocs.yml
     mkdocs_yml = project_dir / "mkdocs.yml"
-    mkdocs_yml.write_text(
-        """site_name: Documentation
-site_description: Project Documentation
-site_author: Your Name
-
-theme:
-  name: material
-  palette:
-    # Light mode
-    - media: "(prefers-color-scheme: light)"
-      scheme: default
-      primary: indigo
-      accent: indigo
-      toggle:
-        icon: material/brightness-7
-        name: Switch to dark mode
-    # Dark mode
-    - media: "(prefers-color-scheme: dark)"
-      scheme: slate
-      primary: indigo
-      accent: indigo
-      toggle:
-        icon: material/brightness-4
-        name: Switch to light mode
-  features:
-    - navigation.tabs
-    - navigation.sections
-    - navigation.top
-    - navigation.tracking
-    - search.suggest
-    - search.highlight
-    - content.tabs.link
-    - content.code.annotation
-    - content.code.copy
-  language: en
-  font:
-    text: Roboto
-    code: Roboto Mono
-
-markdown_extensions:
-  - pymdownx.highlight:
-      anchor_linenums: true
-  - pymdownx.inlinehilite
-  - pymdownx.snippets
-  - admonition
-  - pymdownx.details
-  - pymdownx.superfences:
-      custom_fences:
-        - name: mermaid
-          class: mermaid
-          format: !!python/name:pymdownx.superfences.fence_code_format
-  - pymdownx.tabbed:
-      alternate_style: true
-  - pymdownx.tasklist:
-      custom_checkbox: true
-  - attr_list
-  - md_in_html
-  - pymdownx.emoji:
-      emoji_index: !!python/name:material.extensions.emoji.twemoji
-      emoji_generator: !!python/name:material.extensions.emoji.to_svg
-  - toc:
-      permalink: true
-
-plugins:
-  - search
-
-nav:
-  - Home: index.md
-
-extra:
-  social:
-    - icon: fontawesome/brands/github
-      link: https://github.com/yourusername/yourproject
-"""
-    )
+    shutil.copyfile(_TEMPLATE_DIR / "_template_mkdocs.yml", mkdocs_yml)
+
+    # Keep build output and the page cache out of version control
+    gitignore = project_dir / ".gitignore"
+    existing = gitignore.read_bytes() if gitignore.exists() else b""
+    lines = existing.splitlines()
+    missing = b"".join(entry + b"\n" for entry in _GITIGNORE_ENTRIES if entry not in lines)
+    if missing:
+        if existing and not existing.endswith(b"\n"):
+            missing = b"\n" + missing
+        gitignore.write_bytes(existing + missing)
 
     print(f"✓ Documentation initialized at {docs_dir}")
     print(f"✓ Configuration created at {mkdocs_yml}")
@@ -1,37 +1,51 @@
 #!/usr/bin/env python3
 """Serve MkDocs documentation locally with live reload."""
 
-import argparse
-import subprocess
 import sys
 from pathlib import Path
 
+from _mkdocs_common import (
+    exec_mkdocs,
+    find_config,
+    mkdocs_importable,
+    project_parser,
+    serve_site,
+)
 
-def serve_docs(project_dir: Path, port: int = 8000, host: str = "127.0.0.1") -> int:
-    """Serve documentation with live reload."""
-    mkdocs_yml = project_dir / "mkdocs.yml"
-    if not mkdocs_yml.exists():
-        print(f"Error: mkdocs.yml not found at {mkdocs_yml}")
-        print("Run 'init_docs.py' first to initialize the documentation.")
+
+def serve_docs(
+    project_dir: Path, port: int = 8000, host: str = "127.0.0.1", debounce: float | None = None
+) -> int:
+    """Serve documentation with live reload.
+
+    Rebuilds wait until files have been quiet for ``debounce`` seconds
+    (default 0.75), so a generator touching many files at once causes a single
+    rebuild. The watcher polls every 0.5s, so values below that only collapse
+    changes within a poll. The delay can only be set when mkdocs runs
+    in-process; the ``mkdocs serve`` fallback warns and uses its own.
+    """
+    mkdocs_yml = find_config(project_dir)
+    if mkdocs_yml is None:
         return 1
 
     print(f"Serving documentation at http://{host}:{port}")
     print("Press Ctrl+C to stop")
 
-    cmd = ["mkdocs", "serve", "-a", f"{host}:{port}", "-f", str(mkdocs_yml)]
-    result = subprocess.run(cmd, cwd=project_dir)
-    return result.returncode
+    dev_addr = f"{host}:{port}"
+    if mkdocs_importable():
+        return serve_site(
+            mkdocs_yml, dev_addr=dev_addr, debounce=0.75 if debounce is None else debounce
+        )
+    if debounce is not None:
+        print(
+            "Warning: --debounce is ignored because mkdocs is not importable from this "
+            "interpreter; 'mkdocs serve' uses its own rebuild delay"
+        )
+    return exec_mkdocs("serve", mkdocs_yml, ["-a", dev_addr])
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="Serve MkDocs documentation locally")
-    parser.add_argument(
-        "project_dir",
-        type=Path,
-        nargs="?",
-        default=Path.cwd(),
-        help="Project directory (default: current directory)",
-    )
+    parser = project_parser("Serve MkDocs documentation locally")
     parser.add_argument(
         "--port", "-p", type=int, default=8000, help="Port to serve on (default: 8000)"
     )
@@ -41,9 +55,15 @@ def main() -> int:
         default="127.0.0.1",
         help="Host to serve on (default: 127.0.0.1)",
     )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        help="Seconds of quiet after a file change before rebuilding (default: 0.75; "
+        "needs mkdocs importable in-process)",
+    )
     args = parser.parse_args()
 
-    return serve_docs(args.project_dir, args.port, args.host)
+    return serve_docs(args.project_dir, args.port, args.host, args.debounce)
 
 
 if __name__ == "__main__":
@@ -4,97 +4,182 @@ Verify a Kubernetes deployment is healthy and ready.
 Checks deployment status, pod readiness, and container health.
 """
 
-import json
 import subprocess
 import sys
 import time
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-def run_kubectl(args: list[str]) -> str:
-    """Run kubectl command and return output."""
+
+def run_kubectl(args: list[str]) -> bytes:
+    """Run kubectl command and return raw output (parsed directly as JSON bytes)."""
     try:
-        result = subprocess.run(["kubectl"] + args, capture_output=True, text=True, check=True)
+        result = subprocess.run(["kubectl"] + args, capture_output=True, check=True)
         return result.stdout
     except subprocess.CalledProcessError as e:
-        print(f"Error running kubectl: {e.stderr}", file=sys.stderr)
+        print(f"Error running kubectl: {e.stderr.decode(errors='replace')}", file=sys.stderr)
         raise
 
 
 def get_deployment_status(name: str, namespace: str = "default") -> dict:
     """Get deployment status as JSON."""
     output = run_kubectl(["get", "deployment", name, "-n", namespace, "-o", "json"])
-    return json.loads(output)
+    return json_loads(output)
 
 
 def get_pods_for_deployment(name: str, namespace: str = "default") -> list[dict]:
     """Get all pods belonging to a deployment."""
     output = run_kubectl(["get", "pods", "-n", namespace, "-l", f"app={name}", "-o", "json"])
-    data = json.loads(output)
+    data = json_loads(output)
     return data.get("items", [])
 
 
-def verify_deployment(name: str, namespace: str = "default", timeout: int = 300) -> bool:
-    """
-    Verify deployment is healthy and all pods are ready.
+# Deployments (name, namespace) whose own labels lack ``app=<name>``, so the
+# combined query cannot return them; later polls go straight to two queries.
+_UNLABELED_DEPLOYMENTS: set[tuple[str, str]] = set()
 
-    Args:
-        name: Deployment name
-        namespace: Kubernetes namespace
-        timeout: Maximum time to wait in seconds
 
-    Returns:
-        True if deployment is healthy, False otherwise
+def get_deployment_and_pods(name: str, namespace: str = "default") -> tuple[dict, list[dict]]:
+    """Get a deployment and its pods with a single kubectl round-trip.
+
+    The combined query selects on ``app=<name>``, which must match the
+    deployment's own labels too. If it does not, the deployment is fetched
+    separately (the pods returned already match), and later calls for it use
+    two queries without trying the combined one first.
     """
-    print(f"🔍 Verifying deployment '{name}' in namespace '{namespace}'...")
+    if (name, namespace) in _UNLABELED_DEPLOYMENTS:
+        return get_deployment_status(name, namespace), get_pods_for_deployment(name, namespace)
+
+    output = run_kubectl(
+        ["get", "deployment,pods", "-n", namespace, "-l", f"app={name}", "-o", "json"]
+    )
+    deployment = None
+    pods = []
+    for item in json_loads(output).get("items", []):
+        if item.get("kind") == "Pod":
+            pods.append(item)
+        elif item.get("kind") == "Deployment" and item["metadata"]["name"] == name:
+            deployment = item
+
+    if deployment is None:
+        deployment = get_deployment_status(name, namespace)
+        _UNLABELED_DEPLOYMENTS.add((name, namespace))
+    return deployment, pods
+
+
+def wait_for_deployment(name: str, namespace: str, deadline: float) -> bool:
+    """Poll every 5s until the deployment exists, so a just-applied one is not a failure."""
+    while True:
+        result = subprocess.run(
+            ["kubectl", "get", "deployment", name, "-n", namespace, "-o", "name"],
+            capture_output=True,
+        )
+        if result.returncode == 0:
+            return True
+        if time.monotonic() + 5 > deadline:
+            print(
+                f"Error running kubectl: {result.stderr.decode(errors='replace')}", file=sys.stderr
+            )
+            return False
+        time.sleep(5)
+
+
+def wait_for_rollout(name: str, namespace: str = "default", timeout: int = 300) -> bool:
+    """Block until the deployment rollout completes, streaming kubectl's progress."""
+    result = subprocess.run(
+        [
+            "kubectl",
+            "rollout",
+            "status",
+            f"deployment/{name}",
+            "-n",
+            namespace,
+            f"--timeout={timeout}s",
+        ]
+    )
+    return result.returncode == 0
+
+
+def check_pods(name: str, namespace: str = "default") -> bool:
+    """Check once that every pod of the deployment is running and ready."""
+    try:
+        deployment, pods = get_deployment_and_pods(name, namespace)
+        status = deployment.get("status", {})
 
-    start_time = time.time()
+        desired = status.get("replicas", 0)
+        ready = status.get("readyReplicas", 0)
+        updated = status.get("updatedReplicas", 0)
+        available = status.get("availableReplicas", 0)
 
-    while time.time() - start_time < timeout:
-        try:
-            # Get deployment status
-            deployment = get_deployment_status(name, namespace)
-            status = deployment.get("status", {})
+        print(
+            f"  Replicas - Desired: {desired}, Ready: {ready}, Updated: {updated}, Available: {available}"
+        )
+    except Exception as e:
+        print(f"Error during verification: {e}", file=sys.stderr)
+        return False
 
-            desired = status.get("replicas", 0)
-            ready = status.get("readyReplicas", 0)
-            updated = status.get("updatedReplicas", 0)
-            available = status.get("availableReplicas", 0)
+    all_healthy = True
+    for pod in pods:
+        pod_name = pod["metadata"]["name"]
+        if pod["metadata"].get("deletionTimestamp"):
+            print(f"  ⏳ Pod {pod_name}: terminating, skipped")
+            continue
+        phase = pod["status"].get("phase", "Unknown")
 
-            print(
-                f"  Replicas - Desired: {desired}, Ready: {ready}, Updated: {updated}, Available: {available}"
-            )
+        container_statuses = pod["status"].get("containerStatuses", [])
+        containers_ready = all(cs.get("ready", False) for cs in container_statuses)
 
-            # Check if deployment is ready
-            if desired > 0 and ready == desired and updated == desired and available == desired:
-                # Verify individual pods
-                pods = get_pods_for_deployment(name, namespace)
-                all_healthy = True
+        if phase != "Running" or not containers_ready:
+            print(f"  ⚠️  Pod {pod_name}: phase={phase}, ready={containers_ready}")
+            all_healthy = False
+        else:
+            print(f"  ✅ Pod {pod_name}: healthy")
 
-                for pod in pods:
-                    pod_name = pod["metadata"]["name"]
-                    phase = pod["status"].get("phase", "Unknown")
+    return all_healthy
 
-                    container_statuses = pod["status"].get("containerStatuses", [])
-                    containers_ready = all(cs.get("ready", False) for cs in container_statuses)
 
-                    if phase != "Running" or not containers_ready:
-                        print(f"  ⚠️  Pod {pod_name}: phase={phase}, ready={containers_ready}")
-                        all_healthy = False
-                    else:
-                        print(f"  ✅ Pod {pod_name}: healthy")
+def verify_deployment(name: str, namespace: str = "default", timeout: int = 300) -> bool:
+    """
+    Verify deployment is healthy and all pods are ready.
 
-                if all_healthy:
-                    print(f"✅ Deployment '{name}' is healthy and all pods are ready!")
-                    return True
+    Waits for the deployment to exist, then on ``kubectl rollout status`` (a
+    server-side watch), then checks each pod, re-checking every 5s until the
+    timeout while any pod is not yet healthy. Pods being deleted (e.g. old
+    ReplicaSet pods still Terminating) are skipped.
 
-            time.sleep(5)
+    Args:
+        name: Deployment name
+        namespace: Kubernetes namespace
+        timeout: Maximum time to wait in seconds
 
-        except Exception as e:
-            print(f"Error during verification: {e}", file=sys.stderr)
-            time.sleep(5)
+    Returns:
+        True if deployment is healthy, False otherwise
+    """
+    print(f"🔍 Verifying deployment '{name}' in namespace '{namespace}'...")
 
-    print(f"❌ Timeout waiting for deployment '{name}' to be ready", file=sys.stderr)
-    return False
+    deadline = time.monotonic() + timeout
+    if not wait_for_deployment(name, namespace, deadline):
+        print(f"❌ Deployment '{name}' was not found within {timeout}s", file=sys.stderr)
+        return False
+
+    remaining = max(1, int(deadline - time.monotonic()))
+    if not wait_for_rollout(name, namespace, remaining):
+        print(
+            f"❌ Deployment '{name}' did not finish rolling out within {timeout}s", file=sys.stderr
+        )
+        return False
+
+    while not check_pods(name, namespace):
+        if time.monotonic() + 5 > deadline:
+            print(f"❌ Deployment '{name}' rolled out but some pods are unhealthy", file=sys.stderr)
+            return False
+        time.sleep(5)
+
+    print(f"✅ Deployment '{name}' is healthy and all pods are ready!")
+    return True
 
 
 if __name__ == "__main__":
@@ -40,10 +40,11 @@ def main():
 
     print(f"🚀 Auto-fixing Python code quality issues in: {target}\n")
 
-    # Run Ruff auto-fixes
+    # Run Ruff auto-fixes, including import sorting even if the project's
+    # config does not select the isort rules
     run_command(
-        ["uv", "run", "ruff", "check", "--fix", target],
-        "Ruff auto-fix linting issues",
+        ["uv", "run", "ruff", "check", "--fix", "--extend-select", "I", target],
+        "Ruff auto-fix linting issues and sort imports",
     )
 
     # Run Ruff formatting
@@ -52,12 +53,6 @@ def main():
         "Ruff format code",
     )
 
-    # Sort imports (Ruff handles this too, but being explicit)
-    run_command(
-        ["uv", "run", "ruff", "check", "--select", "I", "--fix", target],
-        "Sort imports",
-    )
-
     print("\n✅ Auto-fix completed!")
     print("💡 Run 'uv run python scripts/check_quality.py' to verify all fixes")
 
@@ -6,9 +6,15 @@ Runs multiple linting and checking tools to ensure code quality.
 
 import subprocess
 import sys
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import NamedTuple
 
+# Lines of each check's output kept for the summary at the end
+OUTPUT_TAIL_LINES = 200
+
 
 class CheckResult(NamedTuple):
     """Result of a single check."""
@@ -16,20 +22,30 @@ class CheckResult(NamedTuple):
     name: str
     passed: bool
     output: str
+    streamed: bool = False
 
 
 def run_command(cmd: list[str], name: str) -> CheckResult:
-    """Run a command and return the result."""
+    """Run a command, streaming its output live, and return the result.
+
+    Each line is echoed as it arrives, prefixed with the check name since
+    checks run concurrently. Only the last OUTPUT_TAIL_LINES lines are kept
+    for the final report, so large tool outputs are not held in memory.
+    """
     try:
-        result = subprocess.run(
+        with subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            check=False,
-        )
-        passed = result.returncode == 0
-        output = result.stdout + result.stderr
-        return CheckResult(name, passed, output)
+        ) as proc:
+            assert proc.stdout is not None
+            tail: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+            for line in proc.stdout:
+                sys.stdout.write(f"[{name}] {line}")
+                tail.append(line)
+            passed = proc.wait() == 0
+        return CheckResult(name, passed, "".join(tail), streamed=True)
     except FileNotFoundError:
         return CheckResult(
             name,
@@ -92,14 +108,19 @@ def main():
 
     print(f"🔍 Running Python code quality checks on: {target}\n")
 
-    checks = [
-        check_ruff_lint(target),
-        check_ruff_format(target),
-        check_mypy(target),
-        check_pytest("tests"),
-        check_bandit(target),
+    check_calls: list[tuple[Callable[[str], CheckResult], str]] = [
+        (check_ruff_lint, target),
+        (check_ruff_format, target),
+        (check_mypy, target),
+        (check_pytest, "tests"),
+        (check_bandit, target),
     ]
 
+    # The checks are independent subprocesses, so run them concurrently;
+    # map() keeps the results in the order above for stable output.
+    with ThreadPoolExecutor(max_workers=len(check_calls)) as executor:
+        checks = list(executor.map(lambda call: call[0](call[1]), check_calls))
+
     all_passed = True
 
     for result in checks:
@@ -108,7 +129,9 @@ def main():
         print(f"{result.name}: {status}")
         print_separator()
 
-        if result.output.strip():
+        # Streamed output was already shown live; repeat the tail of failures
+        # so they are grouped together at the end.
+        if (not result.streamed or not result.passed) and result.output.strip():
             print(result.output)
             print()
 
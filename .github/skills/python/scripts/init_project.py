@@ -4,8 +4,8 @@ Initialize a new Python project with best practices.
 Sets up project structure, configuration, and development tools.
 """
 
+import os
 import sys
-from pathlib import Path
 
 PYPROJECT_TEMPLATE = """[project]
 name = "{project_name}"
@@ -176,64 +176,75 @@ dmypy.json
 Thumbs.db
 """
 
-
-def create_file(path: Path, content: str) -> None:
-    """Create a file with given content."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content)
+# The templates are encoded once and rendered by joining these pieces with the
+# project name, which avoids re-parsing the format mini-language on every call.
+_PYPROJECT_PARTS = [part.encode() for part in PYPROJECT_TEMPLATE.split("{project_name}")]
+_README_PARTS = [part.encode() for part in README_TEMPLATE.split("{project_name}")]
+_GITIGNORE_BYTES = GITIGNORE_TEMPLATE.encode()
+
+
+def create_file(path: str, content: bytes) -> None:
+    """Create a file with given content, creating its parent directory if needed."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # A raw descriptor skips the buffered file object open() would build.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        os.write(fd, content)
+    finally:
+        os.close(fd)
     print(f"✅ Created: {path}")
 
 
 def create_project(project_name: str, path: str | None = None) -> None:
     """Create a new Python project with best practices."""
-    project_dir = Path(path) if path else Path.cwd() / project_name
+    # Plain string paths: this writes a handful of files, and pathlib's import
+    # and per-join object churn would cost more than the work itself.
+    project_dir = os.path.normpath(path) if path else os.path.join(os.getcwd(), project_name)
+    name = project_name.encode()
 
     print(f"🚀 Creating Python project: {project_name}")
     print(f"📁 Location: {project_dir}\n")
 
-    # Create directory structure
-    src_dir = project_dir / "src" / project_name
-    tests_dir = project_dir / "tests"
-    scripts_dir = project_dir / "scripts"
-
-    for directory in [src_dir, tests_dir, scripts_dir]:
-        directory.mkdir(parents=True, exist_ok=True)
+    # Directories are created on demand by create_file
+    src_dir = os.path.join(project_dir, "src", project_name)
+    tests_dir = os.path.join(project_dir, "tests")
+    scripts_dir = os.path.join(project_dir, "scripts")
 
     # Create configuration files
     create_file(
-        project_dir / "pyproject.toml",
-        PYPROJECT_TEMPLATE.format(project_name=project_name),
+        os.path.join(project_dir, "pyproject.toml"),
+        name.join(_PYPROJECT_PARTS),
     )
 
     create_file(
-        project_dir / "README.md",
-        README_TEMPLATE.format(project_name=project_name),
+        os.path.join(project_dir, "README.md"),
+        name.join(_README_PARTS),
     )
 
     create_file(
-        project_dir / ".gitignore",
-        GITIGNORE_TEMPLATE,
+        os.path.join(project_dir, ".gitignore"),
+        _GITIGNORE_BYTES,
     )
 
     # Create source files
     create_file(
-        src_dir / "__init__.py",
-        f'"""The {project_name} package."""\n\n__version__ = "0.1.0"\n',
+        os.path.join(src_dir, "__init__.py"),
+        f'"""The {project_name} package."""\n\n__version__ = "0.1.0"\n'.encode(),
     )
 
     create_file(
-        src_dir / "core.py",
-        '"""Core functionality."""\n\n\ndef example() -> str:\n    """Example function."""\n    return "Hello, World!"\n',
+        os.path.join(src_dir, "core.py"),
+        b'"""Core functionality."""\n\n\ndef example() -> str:\n    """Example function."""\n    return "Hello, World!"\n',
     )
 
     # Create test files
     create_file(
-        tests_dir / "__init__.py",
-        "",
+        os.path.join(tests_dir, "__init__.py"),
+        b"",
     )
 
     create_file(
-        tests_dir / "test_core.py",
+        os.path.join(tests_dir, "test_core.py"),
         f'''"""Tests for core functionality."""
 
 from {project_name}.core import example
@@ -242,18 +253,18 @@ from {project_name}.core import example
 def test_example() -> None:
     """Test example function."""
     assert example() == "Hello, World!"
-''',
+'''.encode(),
     )
 
     # Copy quality check scripts (placeholder - in real use, copy from skill)
     create_file(
-        scripts_dir / "check_quality.py",
-        "# Copy check_quality.py from python skill\n",
+        os.path.join(scripts_dir, "check_quality.py"),
+        b"# Copy check_quality.py from python skill\n",
     )
 
     create_file(
-        scripts_dir / "autofix.py",
-        "# Copy autofix.py from python skill\n",
+        os.path.join(scripts_dir, "autofix.py"),
+        b"# Copy autofix.py from python skill\n",
     )
 
     print(f"\n✅ Project '{project_name}' created successfully!")
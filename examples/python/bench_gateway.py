@@ -14,17 +14,26 @@ Usage:
 
     # Run execution benchmark
     uv run python examples/python/bench_gateway.py exec-bench
+
+    # Sweep a larger throughput run with custom batch sizes
+    uv run python examples/python/bench_gateway.py exec-bench --rapid 500 --batch-sizes 1,5,10,20,50
+
+    # Also write every stats table as JSON for later comparison
+    uv run python examples/python/bench_gateway.py --json-out results.json full
 """
 
 from __future__ import annotations
 
 import atexit
+import json
 import shutil
 import signal
 import statistics
 import subprocess
 import time
+from collections.abc import Callable, Sequence
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from urllib.parse import urlparse
 
 import typer
@@ -50,6 +59,9 @@ DEFAULT_SVC_PORT = 8080
 # Global handle so atexit can clean it up
 _port_forward_proc: subprocess.Popen[bytes] | None = None
 
+# Every stats_table() call records its rows here: {table title: {label: stats}}
+_results: dict[str, dict[str, dict[str, float]]] = {}
+
 
 # ---------------------------------------------------------------------------
 # Port-forward helper
@@ -137,17 +149,40 @@ def ensure_port_forward(
 
 
 class Timer:
-    """Context manager that records elapsed time in milliseconds."""
+    """Context manager that records elapsed time in integer nanoseconds."""
 
     def __init__(self) -> None:
-        self.ms: float = 0.0
+        self.ns: int = 0
 
     def __enter__(self) -> Timer:
-        self._start = time.perf_counter()
+        self._start_ns = time.perf_counter_ns()
         return self
 
     def __exit__(self, *_: object) -> None:
-        self.ms = (time.perf_counter() - self._start) * 1000
+        self.ns = time.perf_counter_ns() - self._start_ns
+
+    @property
+    def ms(self) -> float:
+        return self.ns / 1e6
+
+
+def run_concurrent(fn: Callable[[], object], n: int, concurrency: int) -> tuple[list[float], float]:
+    """Call ``fn`` ``n`` times from ``concurrency`` threads.
+
+    Returns the per-call latencies in ms (in submission order) and the
+    wall-clock time of the whole burst in ms.
+    """
+
+    def _timed(_: int) -> float:
+        t = Timer()
+        with t:
+            fn()
+        return t.ms
+
+    wall = Timer()
+    with wall, ThreadPoolExecutor(max_workers=concurrency) as executor:
+        times = list(executor.map(_timed, range(n)))
+    return times, wall.ms
 
 
 def fmt(ms: float) -> str:
@@ -164,20 +199,27 @@ def compute_stats(times_ms: list[float]) -> dict[str, float]:
     n = len(times_ms)
     if n == 0:
         return {}
+    # Sort once and read every order statistic from it; statistics.median and
+    # min/max would each re-scan (median re-sorts).
     sorted_t = sorted(times_ms)
+    mid = n // 2
     return {
         "n": n,
-        "min": min(times_ms),
-        "avg": statistics.mean(times_ms),
-        "med": statistics.median(times_ms),
-        "p95": sorted_t[int(n * 0.95)] if n >= 5 else max(times_ms),
-        "max": max(times_ms),
+        "min": sorted_t[0],
+        "avg": statistics.fmean(sorted_t),
+        "med": sorted_t[mid] if n % 2 else (sorted_t[mid - 1] + sorted_t[mid]) / 2,
+        "p95": sorted_t[int(n * 0.95)] if n >= 5 else sorted_t[-1],
+        "max": sorted_t[-1],
         "first": times_ms[0],
     }
 
 
-def stats_table(title: str, rows: list[tuple[str, list[float]]]) -> Table:
-    """Build a Rich table with timing statistics."""
+def stats_table(title: str, rows: Sequence[tuple[str, list[float] | dict[str, float]]]) -> Table:
+    """Build a Rich table with timing statistics.
+
+    Each row carries either raw samples in ms or stats already returned by
+    :func:`compute_stats`, so callers that also print the numbers sort once.
+    """
     table = Table(title=title, show_lines=True)
     table.add_column("Label", style="cyan", min_width=30)
     table.add_column("N", justify="right")
@@ -187,8 +229,10 @@ def stats_table(title: str, rows: list[tuple[str, list[float]]]) -> Table:
     table.add_column("Med", justify="right")
     table.add_column("P95", justify="right", style="magenta")
     table.add_column("Max", justify="right", style="red")
+    recorded = _results.setdefault(title, {})
     for label, times in rows:
-        s = compute_stats(times)
+        s = times if isinstance(times, dict) else compute_stats(times)
+        recorded[label] = s
         if not s:
             table.add_row(label, "0", "-", "-", "-", "-", "-", "-")
             continue
@@ -209,11 +253,22 @@ def safe_cleanup_pool(pool_mgr: WarmPoolManager, name: str) -> None:
     """Drain and stop a pool, ignoring errors if it doesn't exist."""
     try:
         pool_mgr.delete_warmpool(name)
-        time.sleep(2)
+        _wait_pool_stopped(pool_mgr, name)
     except GatewayError:
         pass
 
 
+def _wait_pool_stopped(pool_mgr: WarmPoolManager, name: str, timeout: float = 10.0) -> None:
+    """Poll with backoff (0.1s doubling to 1s) until the pool leaves the active list."""
+    delay = 0.1
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if all(p.name != name for p in pool_mgr.list_warmpools()):
+            return
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+
+
 def _ensure_pool(
     pool_mgr: WarmPoolManager,
     name: str,
@@ -227,10 +282,11 @@ def _ensure_pool(
     If previous sessions left pods in allocated state, they are cleaned up
     first so the pool can return to a fully-ready state.
     """
-    try:
-        info = pool_mgr.get_warmpool(name)
-        info.ready_replicas + info.allocated_replicas
-
+    # One list call instead of get_warmpool + GatewayError: a failure while
+    # scaling or waiting must surface rather than fall through to create.
+    existing = {p.name: p for p in pool_mgr.list_warmpools(include_stopped=True)}
+    info = existing.get(name)
+    if info is not None:
         # Clean up stale sessions that hold pods in allocated state
         if info.allocated_replicas > 0:
             console.print(
@@ -240,7 +296,6 @@ def _ensure_pool(
             _cleanup_stale_sessions(pool_mgr, name, gateway_namespace)
             # Re-check after cleanup
             info = pool_mgr.get_warmpool(name)
-            info.ready_replicas + info.allocated_replicas
 
         if info.ready_replicas >= replicas:
             console.print(
@@ -258,8 +313,6 @@ def _ensure_pool(
 
         pool_mgr.wait_for_ready(name, timeout=timeout, poll_interval=2.0, min_ready=replicas)
         return
-    except GatewayError:
-        pass  # pool doesn't exist, create it
 
     console.print(f"Creating pool [cyan]{name}[/cyan] with {replicas} replicas...")
     pool_mgr.create_warmpool(name=name, image=image, replicas=replicas, profile=name)
@@ -480,6 +533,9 @@ def session_bench(
     pool_name: str = typer.Option("bench-session-pool", "--pool", help="Pool name to use."),
     replicas: int = typer.Option(10, "--replicas", "-r", help="Pool replicas."),
     num_sessions: int = typer.Option(10, "--sessions", "-s", help="Number of sessions to create."),
+    concurrency: int = typer.Option(
+        1, "--concurrency", "-c", min=1, help="Create requests in flight at once."
+    ),
     image: str = typer.Option(DEFAULT_IMAGE, "--image", "-i", help="Container image."),
     gateway_namespace: str = typer.Option(
         DEFAULT_NAMESPACE,
@@ -509,27 +565,41 @@ def session_bench(
     console.print("[green]Pool ready.[/green]\n")
 
     # --- Create sessions ---
-    console.print(f"[bold cyan]Creating {num_sessions} sessions...[/bold cyan]")
+    console.print(
+        f"[bold cyan]Creating {num_sessions} sessions ({concurrency} concurrent)...[/bold cyan]"
+    )
     create_times: list[float] = []
     sessions: list[str] = []
-    for i in range(num_sessions):
+
+    def _create_one(_: int) -> tuple[float, str, str]:
         t = Timer()
         with t:
             info = client.create_session(image=image, profile=pool_name)
-        create_times.append(t.ms)
-        sessions.append(info.id)
-        console.print(f"  [{i + 1}/{num_sessions}] {fmt(t.ms)}  pod={info.pod_name}")
+        return t.ms, info.id, info.pod_name
+
+    wall = Timer()
+    with wall, ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for i, (elapsed, sid, pod_name) in enumerate(
+            executor.map(_create_one, range(num_sessions))
+        ):
+            create_times.append(elapsed)
+            sessions.append(sid)
+            console.print(f"  [{i + 1}/{num_sessions}] {fmt(elapsed)}  pod={pod_name}")
+    if concurrency > 1:
+        console.print(
+            f"  Wall-clock: {fmt(wall.ms)}  ({num_sessions / (wall.ms / 1000):.1f} sessions/sec)"
+        )
 
     # --- Results ---
     console.print()
+    s = compute_stats(create_times)
     console.print(
         stats_table(
             "Session Creation Latency",
-            [("POST /v1/sessions", create_times)],
+            [("POST /v1/sessions", s)],
         )
     )
 
-    s = compute_stats(create_times)
     if s:
         console.print(f"\n  [yellow]First response:[/yellow] {fmt(s['first'])}")
         console.print(f"  [green]Average:[/green]        {fmt(s['avg'])}")
@@ -562,10 +632,29 @@ def session_bench(
 # =========================================================================
 
 
+def _check_batch_sizes(value: str) -> str:
+    """Validate ``--batch-sizes`` as comma-separated positive integers."""
+    try:
+        sizes = [int(p) for p in value.split(",")]
+    except ValueError:
+        sizes = []
+    if not sizes or min(sizes) < 1:
+        raise typer.BadParameter(f"expected comma-separated integers >= 1, got {value!r}")
+    return ",".join(map(str, sizes))
+
+
 @app.command()
 def exec_bench(
     pool_name: str = typer.Option("bench-exec-pool", "--pool", help="Pool name."),
     replicas: int = typer.Option(2, "--replicas", "-r", help="Pool replicas."),
+    iterations: int = typer.Option(20, "--iterations", "-n", help="Single-echo samples."),
+    n_rapid: int = typer.Option(50, "--rapid", help="Commands in the throughput test."),
+    batch_sizes: str = typer.Option(
+        "5,10,20",
+        "--batch-sizes",
+        callback=_check_batch_sizes,
+        help="Comma-separated steps per batch request.",
+    ),
     image: str = typer.Option(DEFAULT_IMAGE, "--image", "-i", help="Container image."),
     gateway_namespace: str = typer.Option(
         DEFAULT_NAMESPACE,
@@ -583,6 +672,7 @@ def exec_bench(
     ),
 ) -> None:
     """Benchmark execution performance: single commands, batches, throughput."""
+    sizes = [int(b) for b in batch_sizes.split(",")]
     if port_forward:
         ensure_port_forward(gateway_url, gateway_namespace)
     console.rule("[bold]Execution Benchmark")
@@ -599,10 +689,14 @@ def exec_bench(
 
     rows: list[tuple[str, list[float]]] = []
 
+    # Untimed warmup: the first request pays connection setup and the
+    # sidecar's cold path, which would otherwise skew section 1.
+    client.execute(sid, [{"name": "warmup", "command": ["true"]}])
+
     # 1. Single echo command
-    console.print("[bold cyan]1. Single echo command (20 iterations)[/bold cyan]")
+    console.print(f"[bold cyan]1. Single echo command ({iterations} iterations)[/bold cyan]")
     single_times: list[float] = []
-    for i in range(20):
+    for i in range(iterations):
         t = Timer()
         with t:
             client.execute(sid, [{"name": f"echo-{i}", "command": ["echo", "hello"]}])
@@ -612,20 +706,33 @@ def exec_bench(
     # 2. File write
     console.print("[bold cyan]2. File write ~1.5KB (10 iterations)[/bold cyan]")
     file_times: list[float] = []
+    # Build every request up front so only the round trip is timed.
+    write_steps: list[list[dict[str, object]]] = []
     for i in range(10):
         content = f"benchmark content {i}\n" * 100
+        cmd = f"printf '%s' '{content}' > /workspace/bench_{i}.txt"
+        write_steps.append([{"name": f"write-{i}", "command": ["sh", "-c", cmd]}])
+    for steps in write_steps:
         t = Timer()
         with t:
-            cmd = f"printf '%s' '{content}' > /workspace/bench_{i}.txt"
-            client.execute(
-                sid,
-                [{"name": f"write-{i}", "command": ["sh", "-c", cmd]}],
-            )
+            client.execute(sid, steps)
         file_times.append(t.ms)
     rows.append(("File write (~1.5KB)", file_times))
 
+    # 2b. Upload endpoint: raw bytes in the request body, no shell quoting or argv limit
+    console.print("[bold cyan]2b. File upload 100KB (10 iterations)[/bold cyan]")
+    payload = b"x" * 100_000
+    upload_times: list[float] = []
+    client.upload_file(sid, "bench_upload_warmup.bin", payload)
+    for i in range(10):
+        t = Timer()
+        with t:
+            client.upload_file(sid, f"bench_upload_{i}.bin", payload)
+        upload_times.append(t.ms)
+    rows.append(("File upload (100KB)", upload_times))
+
     # 3. Batch execution
-    for batch_size in [5, 10, 20]:
+    for batch_size in sizes:
         console.print(f"[bold cyan]3. Batch of {batch_size} commands (5 iterations)[/bold cyan]")
         steps = [{"name": f"step-{j}", "command": ["echo", f"step-{j}"]} for j in range(batch_size)]
         batch_times: list[float] = []
@@ -639,7 +746,6 @@ def exec_bench(
         console.print(f"  per-step avg: {fmt(per_step)}")
 
     # 4. Throughput test
-    n_rapid = 50
     console.print(f"[bold cyan]4. Throughput: {n_rapid}x 'true' command[/bold cyan]")
     rapid_times: list[float] = []
     overall = Timer()
@@ -653,6 +759,17 @@ def exec_bench(
     rows.append((f"{n_rapid}x 'true'", rapid_times))
     console.print(f"  Throughput: {throughput:.1f} steps/sec  (total: {fmt(overall.ms)})")
 
+    # Same steps in one request: the gap to the loop above is per-request overhead.
+    rapid_steps = [{"name": f"rb-{i}", "command": ["true"]} for i in range(n_rapid)]
+    batched = Timer()
+    with batched:
+        resp = client.execute(sid, rapid_steps)
+    server_times = [float(r.duration_ms) for r in resp.results]
+    rows.append((f"{n_rapid}x 'true' (server, 1 request)", server_times))
+    console.print(
+        f"  One request: {n_rapid / (batched.ms / 1000):.1f} steps/sec  (total: {fmt(batched.ms)})"
+    )
+
     # Print results
     console.print()
     console.print(stats_table("Execution Benchmark Results", rows))
@@ -898,13 +1015,30 @@ def full(
     # 1. Health check
     console.rule("[bold]Health Check")
     client = GatewayClient(base_url=gateway_url, timeout=timeout)
+    # Open the keep-alive connection untimed so the first sample is not DNS + TCP setup.
+    client.health()
     health_times: list[float] = []
     for _ in range(20):
         t = Timer()
         with t:
             client.health()
         health_times.append(t.ms)
-    console.print(stats_table("Health Check", [("GET /healthz", health_times)]))
+    # Serial samples give per-request latency; a concurrent burst over the same
+    # client shows how much the round trip hides when requests overlap.
+    burst_times, burst_ms = run_concurrent(client.health, 100, 16)
+    console.print(
+        stats_table(
+            "Health Check",
+            [
+                ("GET /healthz", health_times),
+                ("GET /healthz (16 concurrent)", burst_times),
+            ],
+        )
+    )
+    console.print(
+        f"  Concurrent throughput: {len(burst_times) / (burst_ms / 1000):.1f} req/sec  "
+        f"(total: {fmt(burst_ms)})"
+    )
 
     # 2. WarmPool scale
     console.print()
@@ -925,6 +1059,7 @@ def full(
         pool_name="bench-full-session",
         replicas=10,
         num_sessions=10,
+        concurrency=1,
         image=image,
         gateway_namespace=gateway_namespace,
         gateway_url=gateway_url,
@@ -938,6 +1073,9 @@ def full(
     exec_bench(
         pool_name="bench-full-exec",
         replicas=2,
+        iterations=20,
+        n_rapid=50,
+        batch_sizes="5,10,20",
         image=image,
         gateway_namespace=gateway_namespace,
         gateway_url=gateway_url,
@@ -949,6 +1087,22 @@ def full(
     console.rule("[bold green]All Benchmarks Complete")
 
 
+def _write_results(path: Path) -> None:
+    path.write_text(json.dumps(_results, indent=2) + "\n")
+    console.print(f"[dim]Wrote results to {path}[/dim]")
+
+
+@app.callback()
+def main(
+    json_out: str | None = typer.Option(
+        None, "--json-out", help="Write all stats tables (in ms) to this JSON file on exit."
+    ),
+) -> None:
+    """ARL Gateway performance benchmarks."""
+    if json_out is not None:
+        atexit.register(_write_results, Path(json_out))
+
+
 # =========================================================================
 # Entry point
 # =========================================================================
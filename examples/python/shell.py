@@ -73,6 +73,9 @@ class InteractiveTerminal:
 
     def _read_loop(self) -> None:
         """Continuously read WebSocket messages and print output."""
+        # Output arrives as many small PTY chunks; skip the attribute lookups per chunk.
+        write = sys.stdout.write
+        flush = sys.stdout.flush
         while self._running:
             try:
                 msg = self._client.read_message(timeout=0.5)
@@ -81,8 +84,8 @@ class InteractiveTerminal:
 
                 if msg.type == "output" and msg.data:
                     self._need_prompt = True
-                    sys.stdout.write(msg.data)
-                    sys.stdout.flush()
+                    write(msg.data)
+                    flush()
                 elif msg.type == "exit":
                     self._exit_code = msg.exit_code
                     console.print(f"\n[dim]Shell exited with code {msg.exit_code}[/dim]")
@@ -66,6 +66,21 @@ from rich.table import Table
 DEFAULT_GATEWAY_URL = "http://localhost:8080"
 DEFAULT_POOL_IMAGE = "busybox:latest"
 
+# One-shot TCP echo server started in the sandbox by the iroh tunnel test.
+TUNNEL_ECHO_SERVER = """\
+import socket
+s=socket.socket()
+s.setsockopt(socket.SOL_SOCKET,socket.SO_REUSEADDR,1)
+s.bind(('0.0.0.0',9999))
+s.listen(1)
+print('LISTENING',flush=True)
+c,_=s.accept()
+d=c.recv(1024)
+c.sendall(b'ECHO:'+d)
+c.close()
+s.close()
+"""
+
 console = Console()
 
 
@@ -151,10 +166,10 @@ def managed_pool_name(image: str, gateway_namespace: str, profile: str) -> str:
     return f"managed-{digest}"
 
 
-def assert_step_success(result: Any, expected_stdout: str | None = None) -> None:
-    if not result.results:
-        raise AssertionError("execute returned no step results")
-    step = result.results[0]
+def assert_step_success(result: Any, expected_stdout: str | None = None, index: int = 0) -> None:
+    if len(result.results) <= index:
+        raise AssertionError(f"execute returned {len(result.results)} step results")
+    step = result.results[index]
     if step.output.exit_code != 0:
         raise AssertionError(f"step exited {step.output.exit_code}: {step.output.stderr}")
     if expected_stdout is not None and expected_stdout not in step.output.stdout:
@@ -471,10 +486,7 @@ def test_interactive_shell(args: argparse.Namespace) -> None:
         try:
             shell.connect(session.session_id)
             shell.send_input("echo shell-test-ok\n")
-            output = ""
-            deadline = time.time() + 10.0
-            while time.time() < deadline and "shell-test-ok" not in output:
-                output += shell.read_output(timeout=0.5)
+            output = shell.read_until("shell-test-ok", timeout=10.0)
             if "shell-test-ok" not in output:
                 raise AssertionError(f"shell output did not contain marker: {output!r}")
         finally:
@@ -568,8 +580,8 @@ def test_stat_file(args: argparse.Namespace) -> None:
         profile=args.pool_name,
         gateway_url=args.gateway_url,
     ) as session:
-        # Create a file and a subdirectory to stat
-        session.execute(
+        # Create a file and a subdirectory, then stat them, in one round trip
+        result = session.execute(
             [
                 {
                     "name": "setup",
@@ -579,12 +591,6 @@ def test_stat_file(args: argparse.Namespace) -> None:
                         "echo hello > /workspace/stat-test.txt && mkdir -p /workspace/stat-dir",
                     ],
                 },
-            ]
-        )
-
-        # stat existing file
-        result = session.execute(
-            [
                 {
                     "name": "stat_file",
                     "command": [
@@ -594,21 +600,6 @@ def test_stat_file(args: argparse.Namespace) -> None:
                         " && stat -c '%s %a' /workspace/stat-test.txt",
                     ],
                 },
-            ]
-        )
-        step = result.results[0]
-        if step.output.exit_code != 0:
-            raise AssertionError(f"stat existing file failed: {step.output.stderr}")
-        parts = step.output.stdout.strip().split()
-        if len(parts) < 2:
-            raise AssertionError(f"unexpected stat output: {step.output.stdout!r}")
-        size = int(parts[0])
-        if size <= 0:
-            raise AssertionError(f"stat file size should be > 0, got {size}")
-
-        # stat directory
-        result = session.execute(
-            [
                 {
                     "name": "stat_dir",
                     "command": [
@@ -617,13 +608,6 @@ def test_stat_file(args: argparse.Namespace) -> None:
                         "test -d /workspace/stat-dir && echo is_dir=true",
                     ],
                 },
-            ]
-        )
-        assert_step_success(result, "is_dir=true")
-
-        # stat nonexistent file
-        result = session.execute(
-            [
                 {
                     "name": "stat_missing",
                     "command": [
@@ -634,7 +618,23 @@ def test_stat_file(args: argparse.Namespace) -> None:
                 },
             ]
         )
-        assert_step_success(result, "exists=false")
+        assert_step_success(result)
+
+        # stat existing file
+        assert_step_success(result, index=1)
+        stdout = result.results[1].output.stdout
+        parts = stdout.strip().split()
+        if len(parts) < 2:
+            raise AssertionError(f"unexpected stat output: {stdout!r}")
+        size = int(parts[0])
+        if size <= 0:
+            raise AssertionError(f"stat file size should be > 0, got {size}")
+
+        # stat directory
+        assert_step_success(result, "is_dir=true", index=2)
+
+        # stat nonexistent file
+        assert_step_success(result, "exists=false", index=3)
 
 
 def test_list_dir(args: argparse.Namespace) -> None:
@@ -643,8 +643,8 @@ def test_list_dir(args: argparse.Namespace) -> None:
         profile=args.pool_name,
         gateway_url=args.gateway_url,
     ) as session:
-        # Create files and a subdirectory
-        session.execute(
+        # Create files and a subdirectory, then list them, in one round trip
+        result = session.execute(
             [
                 {
                     "name": "setup",
@@ -655,20 +655,19 @@ def test_list_dir(args: argparse.Namespace) -> None:
                         "&& mkdir -p /workspace/subdir && echo c > /workspace/subdir/c.txt",
                     ],
                 },
+                {"name": "ls_root", "command": ["ls", "-1", "/workspace"]},
+                {"name": "ls_subdir", "command": ["ls", "-1", "/workspace/subdir"]},
             ]
         )
+        assert_step_success(result)
 
         # List workspace root
-        result = session.execute([{"name": "ls_root", "command": ["ls", "-1", "/workspace"]}])
-        assert_step_success(result, "a.txt")
-        assert_step_success(result, "b.txt")
-        assert_step_success(result, "subdir")
+        assert_step_success(result, "a.txt", index=1)
+        assert_step_success(result, "b.txt", index=1)
+        assert_step_success(result, "subdir", index=1)
 
         # List subdirectory
-        result = session.execute(
-            [{"name": "ls_subdir", "command": ["ls", "-1", "/workspace/subdir"]}]
-        )
-        assert_step_success(result, "c.txt")
+        assert_step_success(result, "c.txt", index=2)
 
 
 def test_iroh_addr(client: GatewayClient, args: argparse.Namespace) -> None:
@@ -724,17 +723,14 @@ def test_send_stdin(args: argparse.Namespace) -> None:
             shell.send_input("cat <<'STDIN_EOF'\n")
             shell.send_input("stdin-test-payload\n")
             shell.send_input("STDIN_EOF\n")
-            output = ""
-            deadline = time.time() + 10.0
-            while time.time() < deadline and "stdin-test-payload" not in output:
-                output += shell.read_output(timeout=0.5)
+            output = shell.read_until("stdin-test-payload", timeout=10.0)
             if "stdin-test-payload" not in output:
                 raise AssertionError(f"stdin payload not echoed back: {output!r}")
         finally:
             shell.close()
 
 
-def test_iroh_direct_connect(args: argparse.Namespace) -> None:
+def test_iroh_direct_connect(client: GatewayClient, args: argparse.Namespace) -> None:
     """Test iroh QUIC direct-connect: ping, execute, stat, write, read on a single control stream."""
     import asyncio
     import struct
@@ -761,7 +757,6 @@ def test_iroh_direct_connect(args: argparse.Namespace) -> None:
             return header[0], await recv.read_exact(struct.unpack(">I", header[1:5])[0])  # type: ignore[union-attr]
 
         experiment_id = f"iroh-dc-{int(time.time())}"
-        gw = GatewayClient(base_url=args.gateway_url)
         tag_counter = [0]
 
         def next_tag() -> int:
@@ -769,7 +764,7 @@ def test_iroh_direct_connect(args: argparse.Namespace) -> None:
             return tag_counter[0]
 
         try:
-            info = gw.create_managed_session(
+            info = client.create_managed_session(
                 image=args.pool_image, experiment_id=experiment_id
             )
             sid = info.id
@@ -878,15 +873,14 @@ def test_iroh_direct_connect(args: argparse.Namespace) -> None:
                 await ep.close()
         finally:
             with contextlib.suppress(Exception):
-                gw.delete_session(sid)
+                client.delete_session(sid)
             with contextlib.suppress(Exception):
-                gw.delete_experiment(experiment_id)
-            gw.close()
+                client.delete_experiment(experiment_id)
 
     asyncio.run(_run())
 
 
-def test_iroh_tunnel(args: argparse.Namespace) -> None:
+def test_iroh_tunnel(client: GatewayClient, args: argparse.Namespace) -> None:
     """Test tunnel: register, list, data-stream forwarding, close via iroh QUIC."""
     import asyncio
     import struct
@@ -915,7 +909,6 @@ def test_iroh_tunnel(args: argparse.Namespace) -> None:
             return msg_type, data
 
         experiment_id = f"iroh-tunnel-{int(time.time())}"
-        gw = GatewayClient(base_url=args.gateway_url)
         tag_counter = [0]
 
         def next_tag() -> int:
@@ -923,7 +916,7 @@ def test_iroh_tunnel(args: argparse.Namespace) -> None:
             return tag_counter[0]
 
         try:
-            info = gw.create_managed_session(
+            info = client.create_managed_session(
                 image=args.pool_image,
                 experiment_id=experiment_id,
             )
@@ -951,20 +944,7 @@ def test_iroh_tunnel(args: argparse.Namespace) -> None:
                 # Start TCP echo server in sandbox
                 tag = next_tag()
                 req = pb.Request(tag=tag)
-                req.spawn.CopyFrom(pb.SpawnRequest(command=[
-                    "python3", "-c",
-                    "import socket\n"
-                    "s=socket.socket()\n"
-                    "s.setsockopt(socket.SOL_SOCKET,socket.SO_REUSEADDR,1)\n"
-                    "s.bind(('0.0.0.0',9999))\n"
-                    "s.listen(1)\n"
-                    "print('LISTENING',flush=True)\n"
-                    "c,_=s.accept()\n"
-                    "d=c.recv(1024)\n"
-                    "c.sendall(b'ECHO:'+d)\n"
-                    "c.close()\n"
-                    "s.close()\n",
-                ]))
+                req.spawn.CopyFrom(pb.SpawnRequest(command=["python3", "-c", TUNNEL_ECHO_SERVER]))
                 await send_typed(send, MSG_REQUEST, req.SerializeToString())
 
                 while True:
@@ -1040,10 +1020,9 @@ def test_iroh_tunnel(args: argparse.Namespace) -> None:
                 await ep.close()
         finally:
             with contextlib.suppress(Exception):
-                gw.delete_session(sid)
+                client.delete_session(sid)
             with contextlib.suppress(Exception):
-                gw.delete_experiment(experiment_id)
-            gw.close()
+                client.delete_experiment(experiment_id)
 
     asyncio.run(_run())
 
@@ -1199,8 +1178,8 @@ def main() -> int:
         ("List Dir", lambda: test_list_dir(args)),
         ("Iroh Addr", lambda: test_iroh_addr(client, args)),
         ("Send Stdin", lambda: test_send_stdin(args)),
-        ("Iroh Direct Connect", lambda: test_iroh_direct_connect(args)),
-        ("Iroh Tunnel", lambda: test_iroh_tunnel(args)),
+        ("Iroh Direct Connect", lambda: test_iroh_direct_connect(client, args)),
+        ("Iroh Tunnel", lambda: test_iroh_tunnel(client, args)),
         ("Observability", lambda: test_observability(args)),
     ]
 
@@ -13,7 +13,7 @@ import json
 import os
 import time
 import uuid
-from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
 from pathlib import Path
 from typing import Any, BinaryIO, TypeVar
 
@@ -64,6 +64,19 @@ from arl.types import (
 
 _ModelT = TypeVar("_ModelT", bound=BaseModel)
 
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+async def _aiter_chunks(content: Iterable[bytes] | BinaryIO) -> AsyncIterator[bytes]:
+    """Adapt a file object or byte iterable to the async stream httpx.AsyncClient needs."""
+    read_fn = getattr(content, "read", None)
+    if callable(read_fn):
+        while chunk := read_fn(_UPLOAD_CHUNK_SIZE):
+            yield chunk
+        return
+    for chunk in content:
+        yield chunk
+
 
 class AsyncGatewayClient:
     """Async HTTP client for the ARL Gateway API."""
@@ -86,9 +99,11 @@ class AsyncGatewayClient:
         transport = httpx.AsyncHTTPTransport(
             retries=3,
             proxy=proxy_url,
+            # Keep every pooled connection alive: concurrent calls (e.g.
+            # upload_files, gathered executes) would otherwise reconnect each time.
             limits=httpx.Limits(
                 max_connections=20,
-                max_keepalive_connections=5,
+                max_keepalive_connections=20,
                 keepalive_expiry=30.0,
             ),
         )
@@ -285,14 +300,29 @@ class AsyncGatewayClient:
         }
         if sha256:
             headers["X-ARL-SHA256"] = sha256
+        body = content if isinstance(content, str | bytes) else _aiter_chunks(content)
         resp = await self._client.post(
             f"/v1/sessions/{session_id}/upload-file",
-            content=content,
+            content=body,
             headers=headers,
         )
         handle_error(resp)
         return UploadFileResponse.model_validate(resp.json())
 
+    async def upload_files(
+        self,
+        session_id: str,
+        files: Mapping[str, str | bytes],
+    ) -> list[UploadFileResponse]:
+        """Upload several files concurrently, returning responses in ``files`` order.
+
+        The uploads share the client's connection pool, so N files cost
+        roughly one round trip instead of N sequential ones.
+        """
+        return list(await asyncio.gather(*(
+            self.upload_file(session_id, path, content) for path, content in files.items()
+        )))
+
     async def download_file(self, session_id: str, path: str) -> bytes:
         resp = await self._client.post(
             f"/v1/sessions/{session_id}/download-file", json={"path": path},
@@ -323,8 +353,8 @@ class AsyncGatewayClient:
         remote_path: str,
         sha256: str | None = None,
     ) -> UploadFileResponse:
-        data = Path(local_path).read_bytes()
-        return await self.upload_file(session_id, remote_path, data, sha256=sha256)
+        with Path(local_path).open("rb") as file:
+            return await self.upload_file(session_id, remote_path, file, sha256=sha256)
 
     async def download_path(
         self,
@@ -473,7 +503,7 @@ class AsyncGatewayClient:
                 line = line.strip()
                 if not line:
                     continue
-                yield LogEntry.model_validate(json.loads(line))
+                yield LogEntry.model_validate_json(line)
 
     async def list_session_logs(
         self, session_id: str, *, tail: int = 100,
@@ -564,7 +594,7 @@ class AsyncGatewayClient:
                 line = line.strip()
                 if not line:
                     continue
-                yield PoolLogEntry.model_validate(json.loads(line))
+                yield PoolLogEntry.model_validate_json(line)
 
     async def list_pool_logs(self, name: str, *, tail: int = 100) -> list[PoolLogEntry]:
         return [
@@ -842,6 +872,6 @@ class AsyncGatewayClient:
                     pass
         elif event_type == "result":
             try:
-                results.append(StepResult.model_validate(json.loads(data)))
-            except (json.JSONDecodeError, ValueError):
+                results.append(StepResult.model_validate_json(data))
+            except ValueError:
                 pass
@@ -6,8 +6,9 @@ delegate every call to these async implementations.
 
 from __future__ import annotations
 
+import asyncio
 import inspect
-from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, BinaryIO
 
@@ -67,6 +68,12 @@ class AsyncSandboxSession:
 
         >>> session = await AsyncSandboxSession.attach("gw-12345", gateway_url="...")
         >>> result = await session.execute([{"name": "ls", "command": ["ls"]}])
+
+        Share one connection pool across many sessions:
+
+        >>> async with AsyncGatewayClient(base_url="...") as client:
+        ...     async with AsyncSandboxSession(image="python:3.12", client=client) as s:
+        ...         ...
     """
 
     def __init__(
@@ -84,6 +91,7 @@ class AsyncSandboxSession:
         private_containers: Iterable[PrivateContainerSpec | dict[str, Any]] | None = None,
         iroh_addr: str | None = None,
         allow_internet: bool | None = None,
+        client: AsyncGatewayClient | None = None,
     ) -> None:
         self.image = image or ""
         self.mode = mode
@@ -94,7 +102,10 @@ class AsyncSandboxSession:
         self.private_containers = private_containers
         self.allow_internet = allow_internet
 
-        self._client = AsyncGatewayClient(
+        # A caller-supplied client is shared across sessions (one connection
+        # pool, no per-session TCP/TLS setup) and is left open by aclose().
+        self._owns_client = client is None
+        self._client = client or AsyncGatewayClient(
             base_url=gateway_url, timeout=timeout, api_key=api_key,
         )
         self._api_key = api_key
@@ -112,11 +123,12 @@ class AsyncSandboxSession:
         timeout: float = 300.0,
         api_key: str | None = None,
         iroh_addr: str | None = None,
+        client: AsyncGatewayClient | None = None,
     ) -> AsyncSandboxSession:
         """Attach to an existing session by session ID."""
         instance = cls(
             image=None, profile=None, gateway_url=gateway_url,
-            timeout=timeout, api_key=api_key, iroh_addr=iroh_addr,
+            timeout=timeout, api_key=api_key, iroh_addr=iroh_addr, client=client,
         )
         try:
             info = await instance._client.get_session(session_id)
@@ -293,6 +305,16 @@ class AsyncSandboxSession:
             self._session_id, path=path, content=content, sha256=sha256,
         )
 
+    async def upload_files(self, files: Mapping[str, str | bytes]) -> list[UploadFileResponse]:
+        """Upload several files into the session workspace concurrently."""
+        if self._session_id is None:
+            raise SessionNotInitializedError()
+        # Connect iroh (if configured) once up front so the uploads share it.
+        await self._get_iroh()
+        return list(await asyncio.gather(*(
+            self.upload_file(path, content) for path, content in files.items()
+        )))
+
     async def download_file(self, path: str) -> bytes:
         """Download one file from the session workspace into memory."""
         if self._session_id is None:
@@ -381,11 +403,12 @@ class AsyncSandboxSession:
         self._session_info = None
 
     async def aclose(self) -> None:
-        """Close the underlying HTTP client and iroh transport (if any)."""
+        """Close the iroh transport (if any) and the HTTP client, unless it was passed in."""
         if self._iroh is not None:
             await self._iroh.close()
             self._iroh = None
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
 
     async def __aenter__(self) -> AsyncSandboxSession:
         if self._session_id is None:
@@ -434,13 +457,14 @@ class AsyncManagedSession(AsyncSandboxSession):
         devbox: DevboxConfig | dict[str, Any] | None = None,
         iroh_addr: str | None = None,
         allow_internet: bool | None = None,
+        client: AsyncGatewayClient | None = None,
     ) -> None:
         super().__init__(
             image=image, mode=mode, devbox=devbox, profile=profile,
             gateway_url=gateway_url, timeout=timeout, api_key=api_key,
             allocation_timeout_seconds=allocation_timeout_seconds,
             private_containers=private_containers, iroh_addr=iroh_addr,
-            allow_internet=allow_internet,
+            allow_internet=allow_internet, client=client,
         )
         self._image = image
         self._profile = profile
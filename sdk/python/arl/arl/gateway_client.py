@@ -8,7 +8,7 @@ pooling and safe use from Jupyter / existing event loops.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from pathlib import Path
 from typing import Any, BinaryIO, TypeVar
 
@@ -202,6 +202,13 @@ class GatewayClient:
             self._async.upload_file(session_id, path, content, sha256=sha256)
         )
 
+    def upload_files(
+        self,
+        session_id: str,
+        files: Mapping[str, str | bytes],
+    ) -> list[UploadFileResponse]:
+        return self._runner.run(self._async.upload_files(session_id, files))
+
     def download_file(self, session_id: str, path: str) -> bytes:
         return self._runner.run(self._async.download_file(session_id, path))
 
@@ -7,6 +7,7 @@ import concurrent.futures
 import json
 import os
 import threading
+import time
 from collections.abc import Callable
 from contextlib import suppress
 
@@ -249,6 +250,60 @@ class InteractiveShellClient:
             return msg.data
         return ""
 
+    def read_until(self, marker: str, timeout: float = 10.0) -> str:
+        """Read output until ``marker`` appears or ``timeout`` expires.
+
+        Each read blocks on the transport for the remaining time, so output is
+        returned as soon as it arrives instead of on a polling interval.
+
+        Args:
+            marker: Text to wait for (may span several output messages).
+            timeout: Overall deadline in seconds.
+
+        Returns:
+            All output read, which lacks ``marker`` if the deadline passed or
+            the shell exited first.
+        """
+        deadline = time.monotonic() + timeout
+        chunks: list[str] = []
+        tail = ""
+        while (remaining := deadline - time.monotonic()) > 0:
+            msg = self.read_message(timeout=remaining)
+            if msg is None or msg.type == "exit":
+                break
+            if msg.type != "output" or not msg.data:
+                continue
+            chunks.append(msg.data)
+            # Only the end of earlier output can complete a marker split across messages.
+            window = tail + msg.data
+            if marker in window:
+                break
+            tail = window[max(0, len(window) - len(marker) + 1) :] if len(marker) > 1 else ""
+        return "".join(chunks)
+
+    def read_until_idle(self, quiet_for: float = 0.1, max_wait: float = 2.0) -> str:
+        """Read output until the shell has been quiet for ``quiet_for`` seconds.
+
+        Useful when there is no marker to wait for.  Each read blocks for at
+        most ``quiet_for``, so the call returns shortly after output stops.
+
+        Args:
+            quiet_for: Silence in seconds that ends the read.
+            max_wait: Overall deadline in seconds for chatty shells.
+
+        Returns:
+            All output read.
+        """
+        deadline = time.monotonic() + max_wait
+        chunks: list[str] = []
+        while (remaining := deadline - time.monotonic()) > 0:
+            msg = self.read_message(timeout=min(quiet_for, remaining))
+            if msg is None or msg.type == "exit":
+                break
+            if msg.type == "output" and msg.data:
+                chunks.append(msg.data)
+        return "".join(chunks)
+
     def close(self) -> None:
         """Close the shell connection (WebSocket or iroh)."""
         # Tear down iroh resources
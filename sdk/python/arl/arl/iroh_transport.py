@@ -226,12 +226,14 @@ class IrohTransport:
         await self._send_typed(send, MSG_REQUEST, req.SerializeToString())
 
         # Send raw data as length-prefixed frames: [4B len][bytes]...[4B zero]
+        # Slicing a memoryview skips the copy a bytes slice would make; joining
+        # the header still copies each chunk once, so a frame stays a single
+        # bytes object and a single write_all call.
         chunk_size = 1024 * 1024
-        offset = 0
-        while offset < len(data):
-            chunk = data[offset : offset + chunk_size]
+        view = memoryview(data)
+        for offset in range(0, len(view), chunk_size):
+            chunk = view[offset : offset + chunk_size]
             await send.write_all(struct.pack(">I", len(chunk)) + chunk)  # type: ignore[attr-defined]
-            offset += len(chunk)
         await send.write_all(struct.pack(">I", 0))  # type: ignore[attr-defined]
         await send.finish()
 
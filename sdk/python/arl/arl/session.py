@@ -7,7 +7,7 @@ background event loop (see :class:`~arl.gateway_client._SyncRunner`).
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, BinaryIO
 
@@ -250,6 +250,10 @@ class SandboxSession:
             self._async.upload_file(path, content, sha256=sha256)
         )
 
+    def upload_files(self, files: Mapping[str, str | bytes]) -> list[UploadFileResponse]:
+        """Upload several files into the session workspace concurrently."""
+        return self._runner.run(self._async.upload_files(files))
+
     def download_file(self, path: str) -> bytes:
         """Download one file from the session workspace into memory."""
         return self._runner.run(self._async.download_file(path))
@@ -15,6 +15,9 @@ from arl.types import PoolInfo, PoolLogEntry, ResourceRequirements, ToolsSpec
 
 logger = logging.getLogger(__name__)
 
+# wait_for_ready starts polling this fast and doubles up to poll_interval.
+_INITIAL_POLL_INTERVAL = 0.5
+
 
 class WarmPoolManager:
     """Manager for creating and managing WarmPools via the Gateway API.
@@ -76,9 +79,12 @@ class WarmPoolManager:
             image_locality=image_locality,
         )
 
-    def list_warmpools(self) -> list[PoolInfo]:
-        """List WarmPools in the gateway-scoped namespace."""
-        return self._client.list_pools()
+    def list_warmpools(self, *, include_stopped: bool = False) -> list[PoolInfo]:
+        """List WarmPools in the gateway-scoped namespace.
+
+        Stopped (drained) pools are omitted unless ``include_stopped`` is set.
+        """
+        return self._client.list_pools(include_stopped=include_stopped)
 
     def get_warmpool(self, name: str) -> PoolInfo:
         """Get WarmPool info.
@@ -101,14 +107,16 @@ class WarmPoolManager:
         """Wait for a WarmPool to have ready replicas.
 
         Polls the pool status and returns when ready replicas reach
-        ``min_ready``.  Raises PoolNotReadyError immediately if pods
+        ``min_ready``.  The first polls are short and back off to
+        ``poll_interval``, so a pool that becomes ready quickly is noticed
+        without waiting a full interval.  Raises PoolNotReadyError immediately if pods
         are failing (e.g., ImagePullBackOff, CrashLoopBackOff) instead
         of waiting until timeout.
 
         Args:
             name: Name of the WarmPool.
             timeout: Maximum time to wait in seconds.
-            poll_interval: Time between polls in seconds.
+            poll_interval: Maximum time between polls in seconds.
             min_ready: Minimum number of ready replicas to wait for (default 1).
 
         Returns:
@@ -121,6 +129,7 @@ class WarmPoolManager:
         deadline = time.monotonic() + timeout
         last_info: PoolInfo | None = None
         consecutive_failures = 0
+        delay = min(_INITIAL_POLL_INTERVAL, poll_interval)
 
         while time.monotonic() < deadline:
             try:
@@ -149,7 +158,9 @@ class WarmPoolManager:
 
                     consecutive_failures += 1
                     # Fail fast after 2 consecutive checks with failures and no ready pods
-                    # (gives the system a brief chance to recover)
+                    # (gives the system a brief chance to recover, so wait a full
+                    # poll_interval before the second check)
+                    delay = poll_interval
                     if consecutive_failures >= 2:
                         raise PoolNotReadyError(
                             pool_name=name,
@@ -160,7 +171,8 @@ class WarmPoolManager:
             else:
                 consecutive_failures = 0
 
-            time.sleep(poll_interval)
+            time.sleep(delay)
+            delay = min(delay * 2, poll_interval)
 
         # Timeout reached
         diag = ""
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+import os
 from collections.abc import Callable
+from pathlib import Path
 
 import httpx
 import pytest
@@ -75,6 +77,7 @@ class TestAsyncGatewayClient:
             "execute",
             "get_execute_operation",
             "upload_file",
+            "upload_files",
             "download_file",
             "restore",
             "replay_from",
@@ -278,6 +281,45 @@ class TestAsyncGatewayClient:
             assert result.operation_id
         assert posts == 2
 
+    async def test_upload_files_returns_responses_in_order(self) -> None:
+        uploaded: dict[str, bytes] = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/v1/sessions/gw-1/upload-file"
+            path = request.headers["X-ARL-Path"]
+            uploaded[path] = request.content
+            return httpx.Response(
+                200, json={"path": path, "bytesWritten": len(request.content), "sha256": ""},
+            )
+
+        async with _async_client_with_handler(handler) as client:
+            results = await client.upload_files(
+                "gw-1", {"a.txt": "alpha", "b/c.bin": b"\x00\x01"},
+            )
+        assert [r.path for r in results] == ["a.txt", "b/c.bin"]
+        assert [r.bytes_written for r in results] == [5, 2]
+        assert uploaded == {"a.txt": b"alpha", "b/c.bin": b"\x00\x01"}
+
+    async def test_upload_path_streams_file_contents(self, tmp_path: Path) -> None:
+        data = os.urandom(2 * 1024 * 1024 + 17)
+        local = tmp_path / "blob.bin"
+        local.write_bytes(data)
+        received: list[bytes] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["X-ARL-Path"] == "/workspace/blob.bin"
+            assert "Content-Length" not in request.headers
+            received.append(request.content)
+            return httpx.Response(
+                200,
+                json={"path": "/workspace/blob.bin", "bytesWritten": len(request.content)},
+            )
+
+        async with _async_client_with_handler(handler) as client:
+            result = await client.upload_path("gw-1", local, "/workspace/blob.bin")
+        assert received == [data]
+        assert result.bytes_written == len(data)
+
     async def test_replay_response_is_typed(self) -> None:
         def handler(request: httpx.Request) -> httpx.Response:
             body = json.loads(request.content)
@@ -310,6 +352,13 @@ class TestAsyncSandboxSession:
 
         assert session.session_id is None
 
+    async def test_shared_client_outlives_sessions(self) -> None:
+        async with _async_client_with_handler(_session_handler) as client:
+            for _ in range(2):
+                async with AsyncSandboxSession(image="python:3.12", client=client) as session:
+                    assert session.session_id == "gw-1"
+                assert not client._client.is_closed
+
     async def test_execute_without_create_raises(self) -> None:
         session = AsyncSandboxSession(image="python:3.12", gateway_url="http://gateway.test")
         with pytest.raises(RuntimeError, match="No session created"):
@@ -323,6 +372,7 @@ class TestAsyncSandboxSession:
             "restore",
             "replay_from",
             "upload_file",
+            "upload_files",
             "download_file",
             "upload_path",
             "download_path",
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import json
+import types
 from collections.abc import Callable
 
 import httpx
+import pytest
 
 from arl import (
     GatewayClient,
     GatewayError,
     GatewayOperationTimeout,
     InteractiveShellClient,
+    PoolInfo,
     SandboxSession,
     WarmPoolManager,
 )
@@ -33,6 +36,7 @@ def test_gateway_public_routes_have_python_sdk_entrypoints() -> None:
         (GatewayClient, "execute"),
         (GatewayClient, "get_execute_operation"),
         (GatewayClient, "upload_file"),
+        (GatewayClient, "upload_files"),
         (GatewayClient, "download_file"),
         (GatewayClient, "restore"),
         (GatewayClient, "replay_from"),
@@ -57,7 +61,10 @@ def test_gateway_public_routes_have_python_sdk_entrypoints() -> None:
         (GatewayClient, "delete_experiment"),
         (GatewayClient, "health"),
         (InteractiveShellClient, "connect"),
+        (InteractiveShellClient, "read_until"),
+        (InteractiveShellClient, "read_until_idle"),
         (SandboxSession, "replay_from"),
+        (SandboxSession, "upload_files"),
         (SandboxSession, "iter_logs"),
         (SandboxSession, "get_logs"),
         (WarmPoolManager, "list_warmpools"),
@@ -520,3 +527,92 @@ def test_execute_recovery_stops_when_session_is_gone() -> None:
             assert "session" in exc.error
         else:
             raise AssertionError("expected GatewayError")
+
+
+class _FakeShellSocket:
+    def __init__(self, messages: list[dict[str, object]]) -> None:
+        self._messages = [json.dumps(m) for m in messages]
+
+    def recv(self, timeout: float) -> str:
+        if not self._messages:
+            raise TimeoutError
+        return self._messages.pop(0)
+
+
+def test_shell_read_until_matches_marker_split_across_messages() -> None:
+    shell = InteractiveShellClient()
+    shell._ws = _FakeShellSocket(
+        [
+            {"type": "output", "data": "$ echo shell-te"},
+            {"type": "resize", "cols": 80, "rows": 24},
+            {"type": "output", "data": "st-ok\n"},
+            {"type": "output", "data": "never read"},
+        ]
+    )
+    assert shell.read_until("shell-test-ok", timeout=1.0) == "$ echo shell-test-ok\n"
+
+
+def test_shell_read_until_stops_on_exit() -> None:
+    shell = InteractiveShellClient()
+    shell._ws = _FakeShellSocket(
+        [{"type": "output", "data": "partial"}, {"type": "exit", "exit_code": 1}]
+    )
+    assert shell.read_until("missing", timeout=1.0) == "partial"
+
+
+def test_shell_read_until_idle_returns_buffered_output() -> None:
+    shell = InteractiveShellClient()
+    shell._ws = _FakeShellSocket(
+        [{"type": "output", "data": "a\n"}, {"type": "output", "data": "b\n"}]
+    )
+    assert shell.read_until_idle(quiet_for=0.01, max_wait=1.0) == "a\nb\n"
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _manager_with_pool_status(
+    monkeypatch: pytest.MonkeyPatch, ready_after: int | None
+) -> tuple[WarmPoolManager, _FakeClock]:
+    clock = _FakeClock()
+    monkeypatch.setattr(
+        "arl.warmpool.time", types.SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep)
+    )
+    manager = WarmPoolManager(gateway_url="http://gateway.test")
+    calls = 0
+
+    def get_warmpool(name: str) -> PoolInfo:
+        nonlocal calls
+        calls += 1
+        ready = 1 if ready_after is not None and calls > ready_after else 0
+        return PoolInfo(name=name, readyReplicas=ready)
+
+    monkeypatch.setattr(manager, "get_warmpool", get_warmpool)
+    return manager, clock
+
+
+def test_warmpool_wait_for_ready_backs_off_up_to_poll_interval(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    manager, clock = _manager_with_pool_status(monkeypatch, ready_after=5)
+    info = manager.wait_for_ready("pool", timeout=60.0, poll_interval=2.0)
+    assert info.ready_replicas == 1
+    assert clock.sleeps == [0.5, 1.0, 2.0, 2.0, 2.0]
+
+
+def test_warmpool_wait_for_ready_times_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager, clock = _manager_with_pool_status(monkeypatch, ready_after=None)
+    with pytest.raises(TimeoutError):
+        manager.wait_for_ready("pool", timeout=10.0, poll_interval=4.0)
+    assert clock.sleeps == [0.5, 1.0, 2.0, 4.0, 4.0]
+    assert clock.now >= 10.0